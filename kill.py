@@ -1,13 +1,35 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from serial import Serial
 from roboclaw import Roboclaw
 
-serial_kick = Serial('/dev/ttyS1', 38400)
-serial_wheels = Serial('/dev/ttyUSB0', 38400)
+# must match the packet serial baudrate configured on both RoboClaws, set
+# ROBOCLAW_BAUDRATE (eg. to 460800) once they have been configured for it
+BAUDRATE = int(os.environ.get('ROBOCLAW_BAUDRATE', 38400))
+
+# don't hang forever if a RoboClaw never acks the stop command
+serial_kick = Serial('/dev/ttyS1', BAUDRATE, timeout=0.05)
+serial_wheels = Serial('/dev/ttyUSB0', BAUDRATE, timeout=0.05)
 
 rclaw_kick = Roboclaw(serial_kick)
 rclaw_wheels = Roboclaw(serial_wheels)
 
-rclaw_wheels.forward_m1(0)
-rclaw_wheels.forward_m2(0)
-rclaw_kick.forward_m1(0)
-rclaw_kick.forward_m2(0) 
+def stop(rclaw, attempts=3):
+    """Send a single M1 + M2 duty frame, which stops both motors of a
+    controller, until it is acked. Returns False if it never was."""
+    for _ in range(attempts):
+        try:
+            if rclaw.duty_m1_m2(0, 0):
+                return True
+        except OSError:  # eg. the USB adapter was unplugged, try again
+            pass
+    return False
+
+# both controllers are stopped in parallel
+with ThreadPoolExecutor(2) as pool:
+    stopped = {name: pool.submit(stop, rclaw)
+               for name, rclaw in (('wheels', rclaw_wheels), ('kick', rclaw_kick))}
+failed = [name for name, future in stopped.items() if not future.result()]
+if failed:
+    sys.exit('could not stop the {} motors'.format(' and '.join(failed)))
@@ -1,16 +1,29 @@
 import pygame as pg
 import traceback
+import sys
 import math
-import json
+import struct
 import zmq
 import time
-import json
 
 ip = "192.168.8.232"
 port = 5555
 
+# must match robot_controller.py: left stick y, right stick y (-127 to 127,
+# up is positive), left trigger, right trigger (0 or 1)
+CONTROLS = struct.Struct("!bbBB")
+
 context = zmq.Context()
-socket = context.socket(zmq.REQ)
+# Only the most recent controls are worth sending, so keep at most one queued
+# message and never wait on the robot
+socket = context.socket(zmq.PUSH)
+socket.setsockopt(zmq.CONFLATE, 1)
+# Don't queue controls while the robot isn't connected (the send fails
+# instead), detect a dead connection, and don't hang on exit over an unsent
+# message. ZMQ already disables Nagle (TCP_NODELAY) on its TCP sockets.
+socket.setsockopt(zmq.IMMEDIATE, 1)
+socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+socket.setsockopt(zmq.LINGER, 0)
 socket.connect(f"tcp://{ip}:{port}")
 print(f"Connected to {ip} {port}")
 
@@ -27,10 +40,12 @@ vec = pg.math.Vector2
 # initialize pygame
 pg.init()
 #screen = pg.display.set_mode((WIDTH, HEIGHT))
-clock = pg.time.Clock()
 
 pg.joystick.init()
 
+# only QUIT and the joystick axis events are used, don't let pygame queue the rest
+pg.event.set_blocked([pg.MOUSEMOTION, pg.JOYHATMOTION])
+
 deadzone_stick = 0.2
 deadzone_trigger = 0.01
 
@@ -48,95 +63,105 @@ shoulder_r_pos = (510, 4 + offset_y)
 stick_l = vec(0, 0)
 stick_r = vec(0, 0)
 
+# gamepad axes 0-3 as (stick, component), axes 4 and 5 are the triggers
+# (updated from the JOYAXISMOTION events, the axes are never polled)
+stick_axes = ((stick_l, 0), (stick_l, 1), (stick_r, 0), (stick_r, 1))
+
 stick_l_center = vec(214, 175 + offset_y)
 stick_r_center = vec(510, 294 + offset_y)
 
+# sqrt(1 - 0.5 * v^2) for |v| in [0, 1] (maps the square stick range onto a
+# circle), looked up with square_to_circle[int(abs(v) * 255)]
+square_to_circle = [math.sqrt(1 - 0.5 * (i / 255) ** 2) for i in range(256)]
+
 stick_radius = 30
 stick_size = 20
 
 trigger_r = 0
 trigger_l = 0
 
+# stdout is only flushed every `flush_every` frames (about once a second)
+sys.stdout.reconfigure(line_buffering=False)
+flush_every = 60
+frame_count = 0
+
+gamepads = []
+gamepad_count = 0
+
+# Unchanged controls are not sent again, except every `resend_every` frames
+# (5 Hz when idle) so the robot still hears from us while the sticks are idle
+last_controls = None
+idle_frames = 0
+resend_every = 12
 
 # game loop
 running = True
 try:
     while running:
-        clock.tick(60)
+        # sleep until an event arrives, but wake up at least every 16 ms (60 Hz)
+        events = [pg.event.wait(16)] + pg.event.get()
+
+        # detect gamepad (only rebuilt when one is plugged in or removed)
+        if pg.joystick.get_count() != gamepad_count:
+            gamepad_count = pg.joystick.get_count()
+            gamepads = [pg.joystick.Joystick(x) for x in range(gamepad_count)]
+            if len(gamepads) > 0:
+                gamepads[0].init()
 
-        for event in pg.event.get():
+        for event in events:
             if event.type == pg.QUIT:
                 running = False
+            elif (event.type == pg.JOYAXISMOTION and len(gamepads) > 0
+                    and event.instance_id == gamepads[0].get_instance_id()):
+                if event.axis < len(stick_axes):
+                    stick, component = stick_axes[event.axis]
+                    stick[component] = event.value if abs(event.value) > deadzone_stick else 0
+                elif event.axis == 4:
+                    trigger_l = int(event.value > deadzone_trigger)
+                elif event.axis == 5:
+                    trigger_r = int(event.value > deadzone_trigger)
 
-        # detect gamepad
-        gamepads = [pg.joystick.Joystick(x) for x in range(
-            pg.joystick.get_count())]
         if len(gamepads) > 0:
-            gamepads[0].init()
-            axes = gamepads[0].get_numaxes()
-
-            trigger_r = 0
-            trigger_l = 0
-
-            # get axes values
-            for i in range(axes):
-                axis = gamepads[0].get_axis(i)
-                if i == 0 and abs(axis) > deadzone_stick:
-                    # left stick left/right
-                    stick_l.x = axis
-                elif i == 1 and abs(axis) > deadzone_stick:
-                    # left stick up/down
-                    stick_l.y = axis
-                elif i == 2 and abs(axis) > deadzone_stick:
-                    # right stick left/right
-                    stick_r.x = axis
-                elif i == 3 and abs(axis) > deadzone_stick:
-                    # right stick up/down
-                    stick_r.y = axis
-                elif i == 4 and axis > deadzone_trigger:
-                    # left trigger
-                    trigger_l = 1
-                elif i == 5 and axis > deadzone_trigger:
-                    # right trigger
-                    trigger_r = 1
-
             # draw analog sticks
             # left stick
             draw_stick_l = vec(0, 0)
-            draw_stick_l.x = stick_l.x * math.sqrt(1 - 0.5 * stick_l.y ** 2)
-            draw_stick_l.y = -stick_l.y * math.sqrt(1 - 0.5 * stick_l.x ** 2)
+            draw_stick_l.x = stick_l.x * square_to_circle[min(int(abs(stick_l.y) * 255), 255)]
+            draw_stick_l.y = -stick_l.y * square_to_circle[min(int(abs(stick_l.x) * 255), 255)]
             if round(draw_stick_l.length(), 1) >= deadzone_stick:
                 vec_left = stick_l_center + draw_stick_l * stick_radius
-                stick_l = vec(0,0)
             else:
                 vec_left = vec(stick_l_center)
 
             # right stick
             draw_stick_r = vec(0, 0)
-            draw_stick_r.x = stick_r.x * math.sqrt(1 - 0.5 * stick_r.y ** 2)
-            draw_stick_r.y = -stick_r.y * math.sqrt(1 - 0.5 * stick_r.x ** 2)
+            draw_stick_r.x = stick_r.x * square_to_circle[min(int(abs(stick_r.y) * 255), 255)]
+            draw_stick_r.y = -stick_r.y * square_to_circle[min(int(abs(stick_r.x) * 255), 255)]
             if round(draw_stick_r.length(), 1) >= deadzone_stick:
                 vec_right = stick_r_center + draw_stick_r * stick_radius
-                stick_r = vec(0,0)
             else:
                 vec_right = vec(stick_r_center)
 
-            controls = {
-                "left_stick_y": draw_stick_l.y,
-                "right_stick_y": draw_stick_r.y,
-                "left_trigger": trigger_l,
-                "right_trigger": trigger_r
-            }
+            controls = CONTROLS.pack(int(draw_stick_l.y * 127), int(draw_stick_r.y * 127),
+                                     trigger_l, trigger_r)
+            if controls != last_controls:
+                last_controls = controls
+                idle_frames = 0
+            else:
+                idle_frames += 1
 
-            controls_json = json.dumps(controls)
-            socket.send_string(controls_json)
+            if idle_frames % resend_every == 0:
+                try:
+                    socket.send(controls, zmq.NOBLOCK)
+                except zmq.Again:
+                    # robot not connected yet, this frame is dropped
+                    pass
 
-            message = socket.recv_string()
-            print(f"Server replied: {message}\n")
+        elif frame_count % flush_every == 0:
+            sys.stdout.write("No Device plugged in.\n")
 
-        else:
-            text = "No Device plugged in."
-            print(text)
+        frame_count += 1
+        if frame_count % flush_every == 0:
+            sys.stdout.flush()
 
     pg.quit()
 except Exception:
@@ -1,3 +1,3 @@
 """module management for the RoboClaw package"""
-from .roboclaw import Roboclaw
-__all__ = ['Roboclaw']
+from .roboclaw import Roboclaw, RoboclawError
+__all__ = ['Roboclaw', 'RoboclawError']
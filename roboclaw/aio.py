@@ -0,0 +1,168 @@
+"""This module contains an asyncio façade for the `~roboclaw.Roboclaw` driver, so RoboClaws can be
+polled from coroutines (eg. next to a watchdog or a second RoboClaw) without blocking the event
+loop on serial round trips."""
+import asyncio
+import inspect
+from struct import Struct
+from .roboclaw import Roboclaw, RoboclawError
+from .data_manip import crc16_check
+try:
+    import serial_asyncio
+except ImportError: # pyserial-asyncio is only needed by `open_stream()`
+    serial_asyncio = None
+
+_S_B = Struct('>B')
+
+class AsyncRoboclaw:
+    """Wraps a `~roboclaw.Roboclaw` object so that each of its methods returns an awaitable
+    instead of blocking. The serial round trip runs in a worker thread
+    (`asyncio.to_thread()`) and calls are serialized with an `asyncio.Lock`, because the serial
+    port can only carry one request/response at a time.
+
+    :param ~roboclaw.Roboclaw rclaw: The driver object to wrap.
+
+    .. code-block:: python
+
+        async def main():
+            rc = AsyncRoboclaw(Roboclaw(Serial('/dev/ttyACM0', 38400)))
+            while True:
+                print(await rc.read_version(force=True))
+                await asyncio.sleep(1)
+    """
+    def __init__(self, rclaw):
+        self.rclaw = rclaw
+        self._lock = asyncio.Lock()
+
+    def __getattr__(self, name):
+        method = getattr(self.rclaw, name)
+        if name.startswith('_') or not callable(method):
+            raise AttributeError(name)
+
+        async def _call(*args, **kwargs):
+            async with self._lock:
+                return await asyncio.to_thread(method, *args, **kwargs)
+        _call.__name__ = name
+        _call.__doc__ = method.__doc__
+        return _call
+
+class StreamRoboclaw:
+    """Pipelined access to a RoboClaw over the asyncio streams of pyserial-asyncio (see
+    `open_stream()`). Each command is written as soon as it is awaited, without waiting for the
+    replies to the previous commands, so the next frame is built while the previous one is still on
+    the wire. Replies are matched to their requests in order.
+
+    Only the commands that `Roboclaw` generates (the ones that just pack their arguments or unpack
+    a fixed size reply, which includes most ``read_*`` methods) are available. Use `AsyncRoboclaw`
+    for the others.
+
+    :param ~asyncio.StreamReader reader: The stream that receives the replies.
+    :param ~asyncio.StreamWriter writer: The stream that sends the requests.
+    :param ~roboclaw.Roboclaw rclaw: Frames the requests and checks the replies (but does no I/O).
+    :param float timeout: The number of seconds to wait for each reply. Defaults to ``0.1``.
+
+    Like the ones of `Roboclaw`, the read commands raise `~roboclaw.RoboclawError` if the reply
+    timed out or failed its checksum, and the other commands return `False` if they weren't
+    acknowledged.
+
+    .. code-block:: python
+
+        async def main():
+            rc = await open_stream('/dev/ttyACM0', 38400)
+            await asyncio.gather(rc.speed_m1_m2(1000, 1000), rc.read_encoders())
+    """
+    def __init__(self, reader, writer, rclaw, timeout=0.1):
+        self.reader = reader
+        self.writer = writer
+        self.rclaw = rclaw
+        self.timeout = timeout
+        self._replies = asyncio.Lock()  # FIFO, so replies are read in the order of the requests
+
+    async def _request(self, payload, ack, address):
+        # pylint: disable=protected-access
+        frame = bytes(self.rclaw._frame(payload, address))
+        crc = (frame[-2] << 8) | frame[-1] if self.rclaw.packet_serial else 0
+        self.writer.write(frame)
+        # once the frame is written its reply must be read, even if the caller is cancelled,
+        # otherwise it would be read as the reply to the next request
+        return await asyncio.shield(self._reply(ack, crc))
+
+    async def _reply(self, ack, crc):
+        # pylint: disable=protected-access
+        async with self._replies:
+            await self.writer.drain()
+            size = 1 if ack is None else ack + (2 if self.rclaw.packet_serial else 0)
+            try:
+                reply = await asyncio.wait_for(self.reader.readexactly(size), self.timeout)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                await self._discard_input()
+                reply = b''  # makes `_recv()` raise `RoboclawError`
+            if ack is None:
+                if reply and reply != b'\xff':
+                    await self._discard_input()  # a stray byte, the replies are misaligned
+                return reply == b'\xff'
+            if reply and self.rclaw.packet_serial and not crc16_check(reply, crc):
+                # the rest of the bad reply is buffered by `reader`, not by the serial port
+                # (which is what `_recv()` would reset)
+                await self._discard_input()
+                raise RoboclawError('the reply failed its checksum')
+        return self.rclaw._recv(reply, crc)
+
+    async def _discard_input(self):
+        """Drop the rest of a reply that timed out or failed its checksum (what is buffered already
+        and what arrives within another ``timeout``), so it isn't read as the reply to the next
+        request."""
+        while True:
+            try:
+                if not await asyncio.wait_for(self.reader.read(64), self.timeout):
+                    return  # end of the stream
+            except asyncio.TimeoutError:
+                return
+
+    def __getattr__(self, name):
+        spec = getattr(getattr(Roboclaw, name, None), 'spec', None)
+        if spec is None:
+            raise AttributeError(name)
+        cmd, args_struct, reply_struct, convert = spec
+
+        if reply_struct is None:
+            signature = inspect.signature(getattr(Roboclaw, name))
+
+            async def _call(*args, **kwargs):
+                # like the `Roboclaw` methods, the address may be passed by position too
+                bound = signature.bind(None, *args, **kwargs)
+                bound.apply_defaults()
+                address = bound.arguments.pop('address')
+                args = tuple(bound.arguments.values())[1:]
+                if convert is not None:
+                    args = convert(*args)
+                return await self._request(args_struct.pack(cmd, *args), None, address)
+        else:
+            request = _S_B.pack(cmd)
+
+            async def _call(address=None):
+                reply = reply_struct.unpack(await self._request(request, reply_struct.size, address))
+                return reply if convert is None else convert(reply)
+        _call.__name__ = name
+        _call.__doc__ = getattr(Roboclaw, name).__doc__
+        return _call
+
+    async def close(self):
+        """Close the serial port."""
+        self.writer.close()
+        await self.writer.wait_closed()
+
+async def open_stream(url, baudrate=38400, address=0x80, timeout=0.1, **kwargs):
+    """Open a serial port with pyserial-asyncio and return a `StreamRoboclaw` for it.
+
+    :param str url: The name (or pySerial URL) of the serial port that is connected to the RoboClaw.
+    :param int baudrate: The baudrate of the serial port. Defaults to ``38400``.
+    :param int address: See `~roboclaw.Roboclaw`.
+    :param float timeout: See `StreamRoboclaw`.
+
+    Any other keyword arguments are passed to `serial.Serial`.
+    """
+    if serial_asyncio is None:
+        raise ImportError('open_stream() requires the pyserial-asyncio package')
+    reader, writer = await serial_asyncio.open_serial_connection(url=url, baudrate=baudrate, **kwargs)
+    rclaw = Roboclaw(writer.transport.serial, address=address)
+    return StreamRoboclaw(reader, writer, rclaw, timeout)
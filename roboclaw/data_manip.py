@@ -1,5 +1,10 @@
 """A module for manipulating dat including generating CRC values and datatype constraints.
 For more information on how CRC algorithms work: https://www.zlib.net/crc_v3.txt"""
+from array import array
+try:
+    from binascii import crc_hqx
+except ImportError: # not available on all MicroPython/CircuitPython ports
+    crc_hqx = None
 
 def make_poly(bit_length, msb=False):
     """Make `int` "degree polynomial" in which each bit represents a degree who's coefficient is 1
@@ -14,9 +19,61 @@ def make_poly(bit_length, msb=False):
         result += 0xff << int(x * 8)
     return result
 
+def make_table(deg_poly):
+    """Make the 256 entry table used to shift a 16-bit checksum by a whole byte at a time.
+
+    :param int deg_poly: A preset "degree polynomial" in which each bit represents a degree who's
+        coefficient is 1.
+    """
+    table = array('H', [0] * 256)
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = (crc << 1) ^ deg_poly if crc & 0x8000 else crc << 1
+        table[byte] = crc & 0xffff
+    return table
+
+CRC16_TABLE = make_table(0x1021)
+_CRC16_TABLES = {0x1021: CRC16_TABLE}  # the tables of other polynomials are made on first use
+
 def crc16(data, deg_poly=0x1021, init_value=0):
-    """Calculates a checksum of 16-bit length"""
-    return crc_bits(data, 16, deg_poly, init_value)
+    """Calculates a checksum of 16-bit length. The default (CCITT) ``deg_poly`` is computed by the
+    C implemented `binascii.crc_hqx()` when it is available, otherwise (and for any other
+    ``deg_poly``) 1 byte at a time using a lookup table (1 table lookup per byte instead of 8
+    shifts)."""
+    if init_value: # shift out initial value like `crc_bits()` does
+        init_value = crc_bits(b'', 16, deg_poly, init_value)
+    if deg_poly == 0x1021:
+        return crc16_update(data, init_value)
+    table = _CRC16_TABLES.get(deg_poly)
+    if table is None:
+        table = _CRC16_TABLES[deg_poly] = make_table(deg_poly)
+    return _crc16_table(data, init_value, table)
+
+def _crc16_table(data, crc, table):
+    """Continue a running checksum ``crc`` over ``data`` using the ``table`` of a polynomial."""
+    for byte in data:
+        crc = ((crc << 8) & 0xffff) ^ table[(crc >> 8) ^ byte]
+    return crc
+
+def crc16_update(data, crc):
+    """Continue a running CCITT checksum ``crc`` over ``data``. Unlike `crc16()`, ``crc`` is
+    used as is, so a checksum can be computed in parts (eg. a prefix that is computed once)."""
+    if crc_hqx is not None:
+        return crc_hqx(data, crc)
+    return _crc16_table(data, crc, CRC16_TABLE)
+
+def crc16_check(data, crc=0):
+    """Validates a received data ending with its (CCITT) 16-bit checksum in a single pass. Running
+    the checksum over the data and its own checksum leaves a remainder of 0.
+
+    :param bytearray data: The received data followed by the checksum.
+    :param int crc: The running checksum of anything that the received checksum also covers but
+        was not received (eg. the address and command bytes of the request).
+
+    :Returns: `True` if data was uncorrupted. `False` if something went wrong.
+    """
+    return len(data) > 2 and crc16_update(data, crc) == 0
 
 def crc32(data, deg_poly=0x5b06, init_value=0x555555):
     """Calculates a checksum of 32-bit length. Default ``deg_poly`` and ``init_value`` values
@@ -56,7 +113,9 @@ def crc_bits(data, bit_length, deg_poly, init_value):
 def validate16(data, deg_poly=0x1021, init_value=0):
     """Validates a received data by comparing the calculated 16-bit checksum with the
     checksum included at the end of the data"""
-    return validate(data, 16, deg_poly, init_value)
+    if len(data) < 3: # nothing but (at most) a checksum; eg. a read that timed out
+        return False
+    return crc16(data[:-2], deg_poly, init_value) == (data[-2] << 8) | data[-1]
 
 def validate(data, bit_length, deg_poly, init_value):
     """Validates a received  checksum of various sized buffers
@@ -71,9 +130,11 @@ def validate(data, bit_length, deg_poly, init_value):
     :Returns: `True` if data was uncorrupted. `False` if something went wrong.
         (either checksum didn't match or payload is altered).
     """
-    cal_d = crc_bits(data[:-(bit_length / 8)], bit_length, deg_poly, init_value)
+    size = bit_length // 8
+    if len(data) <= size:
+        return False
+    cal_d = crc_bits(data[:-size], bit_length, deg_poly, init_value)
     rcv_d = 0
-    for byte in data[-(bit_length / 8):]:
+    for byte in data[-size:]:
         rcv_d = (rcv_d << 8) | byte
-    print(cal_d == rcv_d)
     return cal_d == rcv_d
@@ -0,0 +1,110 @@
+"""A module for reducing the round-trip latency of the host's serial port.
+
+USB-serial adapters (FTDI, CH340, ...) hold received bytes for up to 16 ms by default before
+handing them to userspace. The RoboClaw protocol is a strict request/response exchange, so that
+latency timer is paid on every single command."""
+# pylint: disable=import-outside-toplevel,protected-access
+import os
+import sys
+
+ASYNC_LOW_LATENCY = 0x2000  #: The ``serial_struct.flags`` bit requesting low latency.
+
+def _set_async_low_latency(fd):
+    """Set the ``ASYNC_LOW_LATENCY`` flag on a Linux tty (same approach as the ``setserial``
+    utility and pySerial's ``set_low_latency_mode()``)."""
+    import array
+    import fcntl
+    import termios
+    tiocgserial = getattr(termios, 'TIOCGSERIAL', 0x541E)
+    tiocsserial = getattr(termios, 'TIOCSSERIAL', 0x541F)
+    buf = array.array('i', [0] * 32)  # big enough to hold a `struct serial_struct`
+    fcntl.ioctl(fd, tiocgserial, buf)
+    buf[4] |= ASYNC_LOW_LATENCY  # `flags` follows the `type`, `line`, `port` & `irq` fields
+    fcntl.ioctl(fd, tiocsserial, buf)
+
+def _set_latency_timer(port, value=1):
+    """Write the latency timer (in ms) exposed by the usb-serial sysfs interface."""
+    name = os.path.basename(os.path.realpath(port))
+    with open('/sys/bus/usb-serial/devices/%s/latency_timer' % name, 'w') as timer:
+        timer.write(str(value))
+
+def _set_comm_timeouts(handle):
+    """Make Windows return from a read as soon as the line goes idle for 1 ms."""
+    import ctypes
+    from ctypes import wintypes
+
+    class COMMTIMEOUTS(ctypes.Structure):  # pylint: disable=too-few-public-methods
+        """The win32 ``COMMTIMEOUTS`` structure"""
+        _fields_ = [
+            ('ReadIntervalTimeout', wintypes.DWORD),
+            ('ReadTotalTimeoutMultiplier', wintypes.DWORD),
+            ('ReadTotalTimeoutConstant', wintypes.DWORD),
+            ('WriteTotalTimeoutMultiplier', wintypes.DWORD),
+            ('WriteTotalTimeoutConstant', wintypes.DWORD),
+        ]
+
+    kernel32 = ctypes.windll.kernel32
+    timeouts = COMMTIMEOUTS()
+    if not kernel32.GetCommTimeouts(handle, ctypes.byref(timeouts)):
+        raise ctypes.WinError()
+    timeouts.ReadIntervalTimeout = 1
+    if not kernel32.SetCommTimeouts(handle, ctypes.byref(timeouts)):
+        raise ctypes.WinError()
+
+def clear_hupcl(ser):
+    """Clear the ``HUPCL`` flag of an open POSIX serial port, so DTR isn't dropped when the port is
+    closed. Many USB-serial adapters reset the connected board when DTR toggles.
+
+    :param ~serial.Serial ser: The open serial port that is connected to the RoboClaw.
+
+    :Returns: `True` if ``HUPCL`` is cleared, otherwise `False` (not a POSIX tty).
+    """
+    fd = getattr(ser, 'fd', None)
+    if fd is None:
+        return False
+    try:
+        import termios
+        attrs = termios.tcgetattr(fd)
+        if attrs[2] & termios.HUPCL:
+            attrs[2] &= ~termios.HUPCL
+            termios.tcsetattr(fd, termios.TCSANOW, attrs)
+        return True
+    except ImportError:
+        return False
+    except termios.error:
+        return False
+
+def set_low_latency(ser):
+    """Request the lowest receive latency the OS/driver allows for an open pySerial port.
+    `~roboclaw.Roboclaw` calls this for the port it is given (once the port is opened, if it
+    isn't open yet).
+
+    :param ~serial.Serial ser: The open serial port that is connected to the RoboClaw.
+
+    :Returns: `True` if any of the latency settings could be applied, otherwise `False`
+        (unsupported platform/driver or insufficient permissions).
+    """
+    if sys.platform.startswith('linux'):
+        # both are tried, not every usb-serial driver maps ``ASYNC_LOW_LATENCY`` onto its timer
+        applied = False
+        fd = getattr(ser, 'fd', None)
+        if fd is not None:
+            try:
+                _set_async_low_latency(fd)
+                applied = True
+            except (OSError, ImportError):
+                pass
+        if getattr(ser, 'port', None):
+            try:
+                _set_latency_timer(ser.port)
+                applied = True
+            except OSError:
+                pass
+        return applied
+    elif sys.platform.startswith('win'):
+        try:
+            _set_comm_timeouts(ser._port_handle)
+            return True
+        except (OSError, AttributeError):
+            pass
+    return False
@@ -0,0 +1,117 @@
+"""This module runs the `~roboclaw.Roboclaw` driver in a separate process, so the blocking serial
+round trips (and the CRC/packing work behind them) don't compete with the caller's loop for the
+GIL. Requests and replies are passed through `multiprocessing.Queue` objects."""
+import inspect
+import multiprocessing as mp
+from queue import Empty
+from .roboclaw import Roboclaw
+
+#: Name prefixes of the commands that set the current output of the motors right away.
+_MOTION = ('forward_', 'backward_', 'turn_', 'left_right_', 'drive_', 'duty_', 'speed_')
+
+def _is_read(name):
+    """Commands whose name starts with ``read_`` or ``get_`` return data from the RoboClaw."""
+    return name.startswith(('read_', 'get_'))
+
+def _is_latest_only(name):
+    """Unbuffered motion commands are made stale by a newer request of the same command (to the
+    same address). Buffered ones (with a ``buffer`` argument) queue up on the RoboClaw and must all
+    be sent."""
+    return name.startswith(_MOTION) and 'buffer' not in inspect.signature(getattr(Roboclaw, name)).parameters
+
+def _address_of(name, args, kwargs):
+    """The ``address`` argument of a request, whether it was passed by position or keyword."""
+    try:
+        return inspect.signature(getattr(Roboclaw, name)).bind(None, *args, **kwargs).arguments.get('address')
+    except TypeError:  # bad arguments, the call itself reports them
+        return None
+
+class SerialWorker(mp.Process):
+    """A process that owns the serial port and the `Roboclaw` driver object.
+
+    Every request that queued up while the previous one was being sent is drained at once and
+    executed in order. The results of read requests are put on ``reply_q``. For unbuffered motion
+    commands (eg. `~Roboclaw.duty_m1_m2()`), only the most recent request (per command and
+    address) is written to the wire; the stale ones are dropped. If a request raises an exception,
+    it is put on ``reply_q`` as the request's result and the worker carries on.
+
+    :param ~multiprocessing.Queue request_q: Requests in the form ``(method_name, args, kwargs)``.
+        A `None` request stops the worker.
+    :param ~multiprocessing.Queue reply_q: Results of the read requests (and the exceptions of any
+        failed request) in the form ``(method_name, result)``.
+    :param str port: The name of the serial port that is connected to the RoboClaw.
+    :param int baudrate: The baudrate of the serial port. Defaults to ``38400``.
+    :param int address: See `Roboclaw`.
+    :param int retries: See `Roboclaw`.
+    """
+    def __init__(self, request_q, reply_q, port, baudrate=38400, address=0x80, retries=3):
+        super().__init__(daemon=True)
+        self.request_q = request_q
+        self.reply_q = reply_q
+        self.port = port
+        self.baudrate = baudrate
+        self.address = address
+        self.retries = retries
+
+    def _drain(self):
+        """Block for one request, then collect any others that are already waiting."""
+        requests = [self.request_q.get()]
+        while True:
+            try:
+                requests.append(self.request_q.get_nowait())
+            except Empty:
+                return requests
+
+    def run(self):
+        from serial import Serial  # pylint: disable=import-outside-toplevel
+        serial_obj = Serial(self.port, self.baudrate)
+        rclaw = Roboclaw(serial_obj, address=self.address, retries=self.retries)
+        running = True
+        while running:
+            requests = self._drain()
+            if None in requests:
+                running = False
+                requests = requests[:requests.index(None)]
+            keys = [(name, _address_of(name, args, kwargs)) if _is_latest_only(name) else None
+                    for name, args, kwargs in requests]
+            latest = {key: i for i, key in enumerate(keys) if key is not None}
+            for i, (name, args, kwargs) in enumerate(requests):
+                if keys[i] is not None and latest[keys[i]] != i:
+                    continue
+                try:
+                    result = getattr(rclaw, name)(*args, **kwargs)
+                except Exception as exc:  # pylint: disable=broad-except
+                    self.reply_q.put((name, exc))
+                    continue
+                if _is_read(name):
+                    self.reply_q.put((name, result))
+
+class RemoteRoboclaw:
+    """A stand-in for the `Roboclaw` class whose methods only queue a request for a
+    `SerialWorker` and return immediately (without a result). The results of ``read_*`` methods
+    are collected later with `get_reply()`.
+
+    :param ~multiprocessing.Queue request_q: The ``request_q`` of the `SerialWorker`.
+    :param ~multiprocessing.Queue reply_q: The ``reply_q`` of the `SerialWorker`.
+    """
+    def __init__(self, request_q, reply_q):
+        self.request_q = request_q
+        self.reply_q = reply_q
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not callable(getattr(Roboclaw, name, None)):
+            raise AttributeError(name)
+
+        def _request(*args, **kwargs):
+            self.request_q.put((name, args, kwargs))
+        _request.__name__ = name
+        return _request
+
+    def get_reply(self, block=False, timeout=None):
+        """Get the next ``(method_name, result)`` reply. Raises `queue.Empty` if there is none
+        (after waiting ``timeout`` seconds when ``block`` is `True`)."""
+        return self.reply_q.get(block, timeout)
+
+    def stop(self):
+        """Ask the `SerialWorker` to exit once it has handled the already queued requests."""
+        self.request_q.put(None)
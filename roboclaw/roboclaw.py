@@ -1,17 +1,158 @@
 """roboclaw driver module contains the roboclaw driver class that controls
 the roboclaw via a UART serial"""
 import os
-from struct import pack, unpack
-from .serial_commands import Cmd
-from .data_manip import crc16, validate16
-
-# pylint: disable=line-too-long,invalid-name,too-many-function-args,too-many-public-methods
-
-# this function doesn't need a self pointer
-def _recv(buf):
-    if validate16(buf):
-        return buf[:-2]
-    return False
+import time
+import inspect
+from functools import update_wrapper
+from contextlib import contextmanager
+from struct import Struct
+from .serial_commands import Cmd, ErrorFlag
+from .data_manip import crc16, crc16_check, crc16_update
+from .lowlatency import clear_hupcl, set_low_latency
+
+# pylint: disable=line-too-long,invalid-name,too-many-function-args,too-many-public-methods,unused-argument
+
+# compiled once instead of parsing the format string on every command
+_S_B = Struct('>B')
+_S_H = Struct('>H')
+_S_h = Struct('>h')
+_S_BB = Struct('>BB')
+_S_BI = Struct('>BI')
+_S_Bh = Struct('>Bh')
+_S_Bi = Struct('>Bi')
+_S_HH = Struct('>HH')
+_S_IB = Struct('>IB')
+_S_II = Struct('>II')
+_S_Ib = Struct('>Ib')
+_S_hh = Struct('>hh')
+_S_iB = Struct('>iB')
+_S_ii = Struct('>ii')
+_S_BBB = Struct('>BBB')
+_S_BBH = Struct('>BBH')
+_S_BHH = Struct('>BHH')
+_S_BII = Struct('>BII')
+_S_BIi = Struct('>BIi')
+_S_BhI = Struct('>BhI')
+_S_Bhh = Struct('>Bhh')
+_S_Bii = Struct('>Bii')
+_S_BBBB = Struct('>BBBB')
+_S_BIii = Struct('>BIii')
+_S_BiIB = Struct('>BiIB')
+_S_iiii = Struct('>iiii')
+_S_BIIII = Struct('>BIIII')
+_S_BIiIB = Struct('>BIiIB')
+_S_BIiIi = Struct('>BIiIi')
+_S_BhIhI = Struct('>BhIhI')
+_S_BIIIIB = Struct('>BIIIIB')
+_S_BiIiIB = Struct('>BiIiIB')
+_S_BIiIiIB = Struct('>BIiIiIB')
+_S_IIIIIII = Struct('>IIIIIII')
+_S_BIIIIIII = Struct('>BIIIIIII')
+_S_BIiIIiIB = Struct('>BIiIIiIB')
+_S_BIIIIIIIIB = Struct('>BIIIIIIIIB')
+_pack_crc = _S_H.pack_into  # writes the CRC16 checksum straight into the frame
+# the running checksum of each address byte, so only the rest of a frame is fed to the CRC16
+_ADDRESS_CRC = {address: crc16(bytes([address])) for address in range(0x80, 0x88)}
+
+def _min_voltage_value(volts):
+    """``(volts - 6) x 5`` (rounded, so float error like 6.6 V giving 2.999... doesn't drop a step) as
+    the byte sent by the deprecated minimum voltage setters."""
+    return max(0, min(255, round((volts - 6) * 5)))
+
+def _max_voltage_value(volts):
+    """``volts x 5.12`` (rounded up, like the datasheet's examples) as the byte sent by the
+    deprecated maximum voltage setters."""
+    return max(0, min(255, int(-(-volts * 128 // 25))))
+
+def _compile(stub, body, **namespace):
+    """Compile a method with the very same signature as ``stub`` (so the interpreter binds the
+    arguments) that runs the ``body`` statement. Besides the arguments, ``body`` can only use the
+    names given as ``namespace``."""
+    params = ', '.join(str(param) for param in inspect.signature(stub).parameters.values())
+    exec('def {}({}):\n    {}\n'.format(stub.__name__, params, body), namespace)  # pylint: disable=exec-used
+    return update_wrapper(namespace[stub.__name__], stub)
+
+def _command(cmd, struct, convert=None):
+    """Generate a command method from a stub that only documents it. The stub's arguments (except
+    ``address``) are packed with ``struct`` after the ``cmd`` byte and sent with
+    `Roboclaw._send_packed()`, which expects the blanket ack.
+
+    :param int cmd: The command byte (from `Cmd`).
+    :param ~struct.Struct struct: The format of the command byte followed by the arguments.
+    :param callable convert: Turns the stub's arguments into the `tuple` of values to pack.
+    """
+    framed = Struct('>B' + struct.format.lstrip('>'))  # the address byte, then ``struct``
+
+    def decorator(stub):
+        names = list(inspect.signature(stub).parameters)[1:-1]  # not ``self`` nor ``address``
+        if convert is None:
+            args = '({})'.format(''.join(name + ', ' for name in names))
+        else:
+            args = '_convert({})'.format(', '.join(names))
+        method = _compile(stub, 'return self._send_packed(_framed, _cmd, {}, address)'.format(args),
+                          _framed=framed, _cmd=cmd, _convert=convert)
+        method.spec = (cmd, struct, None, convert)  # (command byte, arguments, reply, conversion)
+        return method
+    return decorator
+
+def _getter(cmd, struct, convert=None):
+    """Generate a read method from a stub that only documents it. The method sends the ``cmd``
+    byte and returns the reply unpacked with ``struct``.
+
+    :param int cmd: The command byte (from `Cmd`).
+    :param ~struct.Struct struct: The format of the reply (not including the CRC16 checksum).
+    :param callable convert: Turns the unpacked `tuple` into the method's return value.
+
+    The generated method raises `RoboclawError` if the reply timed out or failed its checksum.
+    """
+    def decorator(stub):
+        reply = '_unpack(self._recv(self._send(_request, address=address, ack=_ack)))'
+        if convert is not None:
+            reply = '_convert({})'.format(reply)
+        method = _compile(stub, 'return ' + reply, _request=_S_B.pack(cmd), _ack=struct.size,
+                          _unpack=struct.unpack, _convert=convert)
+        method.spec = (cmd, None, struct, convert)  # (command byte, arguments, reply, conversion)
+        return method
+    return decorator
+
+# reciprocals of the fixed point scales, exact because they are powers of 2 (unlike 10ths)
+_INV_1024 = 1.0 / 1024
+_INV_65536 = 1.0 / 65536
+
+def _tenths(val):
+    """Scale a reply in 10ths (eg. of a volt)."""
+    return val[0] / 10
+
+def _error_flags(val):
+    """Decode a unit status reply into its `ErrorFlag` bits."""
+    return ErrorFlag(val[0])
+
+def _with_status(val):
+    """Prefix a reply with the ``1`` (success) status that the older API returned."""
+    return (1,) + val
+
+def _position_pid(data):
+    """Scale the fixed point (x1024) P, I and D values of a position PID reply."""
+    kp, ki, kd = data[:3]
+    return (1, kp * _INV_1024, ki * _INV_1024, kd * _INV_1024) + data[3:]
+
+def _position_pid_args(kp, ki, kd, kimax, deadzone, minimum, maximum):
+    """Scale (x1024, to fixed point) and reorder (D first) the arguments of the position PID setters."""
+    return (int(kd * 1024), int(kp * 1024), int(ki * 1024), kimax, deadzone, minimum, maximum)
+
+def _velocity_pid(data):
+    """Scale the fixed point (16.16) P, I and D values of a velocity PID reply."""
+    p, i, d, qpps = data
+    return (p * _INV_65536, i * _INV_65536, d * _INV_65536, qpps)
+
+def _velocity_pid_args(p, i, d, qpps):
+    """Scale (x65536, to 16.16 fixed point) and reorder (D first) the arguments of the velocity PID
+    setters."""
+    return (int(d * 65536), int(p * 65536), int(i * 65536), qpps)
+
+class RoboclawError(Exception):
+    """Raised when a reply to a read command timed out or failed its CRC16 checksum (after all the
+    retries of the request)."""
 
 class Roboclaw:
     """A driver class for the RoboClaw Motor Controller device.
@@ -19,15 +160,65 @@ class Roboclaw:
     :param ~serial.Serial serial_obj: The serial obj associated with the serial port that is connected to the RoboClaw.
     :param int address: The unique address assigned to the particular RoboClaw. Valid addresses range [``0x80``, ``0x87``].
     :param int retries: The amount of attempts to read/write data over the serial port. Defaults to 3.
+
+    The serial port is opened once (on the first command if it isn't open already) and stays open
+    between commands. Use `close()` or a ``with`` block to release it. On POSIX hosts the port's
+    ``HUPCL`` flag is cleared, so closing it doesn't toggle DTR. On Linux/Windows hosts the port is
+    also switched to low latency mode (see `~roboclaw.lowlatency.set_low_latency()`).
     """
+    #: The number of queued bytes that makes a batch (see `begin_batch()`) get written right away.
+    BATCH_SIZE = 256
+    #: The number of distinct command frames (see `_send_packed()`) that are kept for reuse.
+    FRAME_CACHE_SIZE = 64
+
     def __init__(self, serial_obj, address=0x80, retries=3, packet_serial=True):
         self.serial_obj = serial_obj
-        self.serial_obj.close()
+        #: `True` if the serial port could be switched to low latency mode, so replies don't wait
+        #: for the USB-serial latency timer (see `~roboclaw.lowlatency.set_low_latency()`). A port
+        #: that isn't open yet is switched (and this is updated) when it is opened.
+        self.low_latency = False
+        if getattr(serial_obj, 'is_open', True):
+            self._tune_port()
         self._retries = retries
         self.packet_serial = packet_serial #: this `bool` represents if using packet serial mode.
-        if address not in range(0x80, 0x88):
-            raise ValueError('Unsupported specified address: {address}')
+        if not 0x80 <= address <= 0x87:
+            raise ValueError('Unsupported specified address: {}'.format(address))
         self._address = address
+        self._versions = {}  # firmware version strings cached per address
+        self._txbuf = bytearray(64)  # reused to frame every outgoing command
+        self._rxbuf = bytearray(64)  # reused to receive every fixed size response
+        self._rx_crc = 0  # checksum of the last request's address and command (see `_recv()`)
+        self._batch = None  # frames queued by `begin_batch()`, `None` when not batching
+        self._batch_acks = 0  # the number of blanket acks the queued frames will get
+        self._batch_ok = True  # all auto-flushed batches were acknowledged
+        self._frames = {}  # complete frames of the payload-less commands
+        self._command_frames = {}  # the most recent (in insertion order) frames of `_send_packed()`
+        self._framesbuf = bytearray()  # reused to join the frames written by `_send_many()`
+        self._batchbuf = bytearray()  # reused to queue the frames of every batch
+
+    def __enter__(self):
+        self._open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _open(self):
+        """Open the serial port if it isn't open already (eg. after `close()`)."""
+        if not getattr(self.serial_obj, 'is_open', True):
+            self.serial_obj.open()
+            self._tune_port()
+
+    def _tune_port(self):
+        """Apply the settings that need an open port (its file descriptor), again after every
+        reopen because they may not survive it."""
+        clear_hupcl(self.serial_obj)  # don't reset the board when the port is closed/reopened
+        self.low_latency = set_low_latency(self.serial_obj)
+
+    def close(self):
+        """Close the serial port. It is reopened by the next command."""
+        self.serial_obj.close()
 
     @property
     def address(self):
@@ -37,14 +228,54 @@ class Roboclaw:
 
     @address.setter
     def address(self, addr):
-        assert addr in range(0x80, 0x88)
+        if not 0x80 <= addr <= 0x87:
+            raise ValueError('Unsupported specified address: {}'.format(addr))
         self._address = addr
 
+    def _frame(self, buf, address=None):
+        """Prefix the address byte and (if using packet serial mode) append the CRC16 checksum.
+        The message is framed in a write buffer that is reused by every command.
+
+        :param bytearray buf: the message to frame (not including address nor CRC16 checksum)
+        :param int address: See `_send()`.
+
+        :Returns: A `memoryview` of the framed message. It is only valid until the next call to `_frame()`.
+            Commands without a payload are framed once per address and returned as cached `bytes`.
+        """
+        if address is None:
+            address = self._address
+        elif address not in _ADDRESS_CRC:
+            raise ValueError('Unsupported specified address: {}'.format(address))
+        if len(buf) == 1: # a getter (or reset) frame never changes
+            key = (address, buf[0], self.packet_serial)
+            frame = self._frames.get(key)
+            if frame is None:
+                frame = self._frames[key] = bytes(self._frame_into(buf, address))
+            return frame
+        return self._frame_into(buf, address)
+
+    def _frame_into(self, buf, address):
+        """Frame ``buf`` for ``address`` in the reused write buffer (see `_frame()`)."""
+        size = len(buf) + 1
+        if size + 2 > len(self._txbuf):
+            self._txbuf = bytearray(size + 2)
+        txbuf = self._txbuf
+        txbuf[0] = address
+        txbuf[1:size] = buf
+        if self.packet_serial:
+            _pack_crc(txbuf, size, crc16_update(memoryview(txbuf)[1:size], _ADDRESS_CRC[address]))
+            size += 2
+        return memoryview(txbuf)[:size]
+
     def _send(self, buf, ack=None, address=None, crc=True):
         """
         :param bytearray buf: the message to send (not including address nor CRC16 checksum)
         :param int ack: Expected number of bytes to read in response. `None` reads 1 byte
-            (expceted to be ``0xFF``) and returns `True` if successful.
+            (expceted to be ``0xFF``) and returns `True` if successful. ``0`` reads a string
+            terminated by ``\n`` and ``\0`` (and its checksum) as `bytes`. Otherwise the response is
+            read into a buffer that is reused by every command, so the returned `memoryview` is
+            only valid until the next command. The reply is read with a single
+            ``readinto()`` call. A reply that times out short is requested again.
         :param int address: The default `None` value invokes using the internally saved address
             byte (passed to constructor upon instantiation -- defaults to ``0x80``). If using the
             same `Roboclaw` objectfor a different Roboclaw device, pass the address allocated to
@@ -55,52 +286,238 @@ class Roboclaw:
             serial" mode using the Ion Motion Studio software or using `set_config()` and setting
             `packet_serial` to `False`.
         """
-        trys = self._retries
-        assert address is None or address in range(0x80, 0x88)
-        buf = bytes(([self._address] if address is None else [address])) + buf
+        buf = self._frame(buf, address)
+        if ack is None and self._batch is not None:
+            return self._queue(buf)
+        if self._batch: # a reply can't get past the queued acks
+            self._write_batch()
+        if ack is not None and self.packet_serial: # the reply's checksum continues from this one
+            self._rx_crc = (buf[-2] << 8) | buf[-1]
+        self._open()
+        for _ in range(self._retries):
+            self.serial_obj.write(buf)
+            if ack is None: # expects blanket ack
+                if self.serial_obj.read(1) == b'\xff': # empty on timeout
+                    return True
+            elif not ack: # a string terminated w/ '\n' and '\0' chars (then the checksum)
+                reply = self.serial_obj.read_until()
+                if reply[-1:] == b'\n':
+                    trailer = self.serial_obj.read(3 if self.packet_serial and crc else 1)
+                    if len(trailer) == (3 if self.packet_serial and crc else 1):
+                        return reply + trailer
+                self._reset_input()  # timed out, drop the rest before requesting again
+            else: # for passing ack to _recv()
+                size = ack + (2 if self.packet_serial and crc else 0)
+                if size > len(self._rxbuf):
+                    self._rxbuf = bytearray(size)
+                rxbuf = memoryview(self._rxbuf)[:size]
+                # the whole reply (and its checksum) is read at once, `None` on timeout (MicroPython)
+                if (self.serial_obj.readinto(rxbuf) or 0) == size:
+                    return rxbuf
+                # a short reply timed out, drop what may still trickle in before requesting again
+                self._reset_input()
+        return False
+
+    def _reset_input(self):
+        """Drop any received bytes that weren't read (eg. the rest of a reply that timed out), so
+        they don't shift the next reply."""
+        reset_input = getattr(self.serial_obj, 'reset_input_buffer', None)
+        if reset_input is not None:
+            reset_input()
+
+    def _recv(self, buf, crc=None):
+        """Check the CRC16 checksum of a reply and strip it off without copying the payload. The
+        RoboClaw's checksum also covers the address and command bytes of the request, so the check
+        continues from the checksum of the request (which is what the request's own checksum is).
+
+        :param bytearray buf: The reply to the last request sent by `_send()`.
+        :param int crc: The checksum of the request's address and command bytes. Defaults to the
+            one of the last request sent by `_send()`.
+
+        :Returns: A `memoryview` of the payload.
+        :Raises RoboclawError: If ``buf`` is empty or `False` (the reply timed out) or the
+            checksum didn't match. Unread bytes of a mismatched reply are dropped, so they don't
+            shift the next reply.
+        """
+        if not buf:
+            raise RoboclawError('the reply timed out')
+        if not self.packet_serial:
+            return memoryview(buf)
+        if crc16_check(buf, self._rx_crc if crc is None else crc):
+            return memoryview(buf)[:-2]
+        self._reset_input()
+        raise RoboclawError('the reply failed its checksum')
+
+    def _send_packed(self, struct, cmd, args, address=None):
+        """Like `_send()` for commands that expect the blanket ack, but the address, ``cmd`` byte
+        and ``args`` are packed straight into the reused write buffer (see `_pack_frame()`).
+        The last `FRAME_CACHE_SIZE` distinct frames are kept, so repeating a command with the same
+        arguments (eg. ``duty_m1_m2(0, 0)`` in a control loop) skips the packing and checksum.
+
+        :param ~struct.Struct struct: The format of the address byte, ``cmd`` byte and ``args``.
+        :param int cmd: The command byte (from `Cmd`).
+        :param tuple args: The command's arguments.
+        :param int address: See `_send()`.
+        """
+        if address is None:
+            address = self._address
+        key = (address, cmd, args, self.packet_serial)
+        frame = self._command_frames.get(key)
+        if frame is None:
+            frame = self._pack_frame(struct, cmd, args, address)
+            if len(self._command_frames) >= self.FRAME_CACHE_SIZE:
+                del self._command_frames[next(iter(self._command_frames))]  # the oldest one
+            self._command_frames[key] = frame
+        if self._batch is not None:
+            return self._queue(frame)
+        self._open()
+        for _ in range(self._retries):
+            self.serial_obj.write(frame)
+            if self.serial_obj.read(1) == b'\xff': # empty on timeout
+                return True
+        return False
+
+    def _pack_frame(self, struct, cmd, args, address):
+        """Frame a command for `_send_packed()` in the reused write buffer.
+
+        :Returns: The framed command as `bytes`.
+        """
+        seed = _ADDRESS_CRC.get(address)
+        if seed is None:
+            raise ValueError('Unsupported specified address: {}'.format(address))
+        size = struct.size
+        if size + 2 > len(self._txbuf):
+            self._txbuf = bytearray(size + 2)
+        txbuf = self._txbuf
+        struct.pack_into(txbuf, 0, address, cmd, *args)
         if self.packet_serial:
-            checksum = crc16(buf)
-            buf += bytes([checksum >> 8, checksum & 0xff])
-        with self.serial_obj:
-            while trys:
-                self.serial_obj.write(buf)
-                if ack is None: # expects blanket ack
-                    response = self.serial_obj.read(1)
-                    if response: # if not timeout
-                        if unpack('>B', response)[0] == 0xff:
-                            return True
-                elif not ack:
-                    return self.serial_obj.read_until() # special case ack terminated w/ '\n' char
-                else: # for passing ack to _recv()
-                    return self.serial_obj.read(ack + (2 if self.packet_serial and crc else 0))
-                trys -= 1
+            _pack_crc(txbuf, size, crc16_update(memoryview(txbuf)[1:size], seed))
+            size += 2
+        return bytes(memoryview(txbuf)[:size])
+
+    def _send_many(self, bufs, address=None):
+        """Send several commands that expect the blanket ack (``0xFF``) in a single serial write.
+
+        :param list bufs: the messages to send (each not including address nor CRC16 checksum)
+        :param int address: See `_send()`.
+
+        :Returns: `True` if every command was acknowledged.
+        """
+        if self._batch is not None:
+            return all([self._queue(self._frame(buf, address=address)) for buf in bufs])
+        trys = self._retries
+        frames = self._framesbuf
+        del frames[:]
+        for buf in bufs:
+            frames += self._frame(buf, address=address)
+        self._open()
+        while trys:
+            self.serial_obj.write(frames)
+            if self.serial_obj.read(len(bufs)) == b'\xff' * len(bufs):
+                return True
+            trys -= 1
         return False
 
+    def _queue(self, frame):
+        """Append a frame to the batch started by `begin_batch()`. The batch is written once it
+        holds `BATCH_SIZE` bytes."""
+        self._batch += frame
+        self._batch_acks += 1
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._write_batch()
+        return True
+
+    def _write_batch(self):
+        """Write the queued frames in a single serial write and check all their acks. Batching
+        stays on."""
+        acks = self._batch_acks
+        self._batch_acks = 0
+        self._open()
+        self.serial_obj.write(self._batch)
+        del self._batch[:]  # the write has copied the frames, so the buffer is reused
+        if self.serial_obj.read(acks) != b'\xff' * acks:
+            self._batch_ok = False
+
+    def begin_batch(self):
+        """Queue the commands that only expect the blanket ack (eg. the ``set_*``, ``duty_*`` and
+        ``speed_*`` commands) instead of writing each one, so that they are all written in a single
+        serial write by `flush_batch()`. Queued commands return `True` right away, their acks are
+        checked by `flush_batch()`.
+
+        A command that returns data (or more than `BATCH_SIZE` bytes of queued commands) writes
+        the queued commands first. Batched commands are not retried.
+        """
+        if self._batch is None:
+            self._batch = self._batchbuf
+            del self._batch[:]
+            self._batch_acks = 0
+            self._batch_ok = True
+
+    def flush_batch(self):
+        """Write the commands queued since `begin_batch()` and stop batching.
+
+        :Returns: `True` if every queued command was acknowledged.
+        """
+        if self._batch:
+            self._write_batch()
+        self._batch = None
+        return self._batch_ok
+
+    @contextmanager
+    def batch(self):
+        """A context manager that calls `begin_batch()` and `flush_batch()`.
+
+        .. code-block:: python
+
+            with rclaw.batch():
+                rclaw.speed_m1_m2(1000, 1000)
+                rclaw.duty_m1_m2(0, 0, address=0x81)
+        """
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.flush_batch()
+
+    def _send_pair(self, name, m1_args, m2_args, address=None):
+        """Call ``set_m1_<name>()`` and ``set_m2_<name>()`` so that both commands go out in a single
+        serial write (they are just queued if a batch is already started by `begin_batch()`).
+
+        :Returns: `True` if both commands were acknowledged (or queued).
+        """
+        set_m1, set_m2 = getattr(self, 'set_m1_' + name), getattr(self, 'set_m2_' + name)
+        if self._batch is not None:
+            return set_m1(*m1_args, address=address) and set_m2(*m2_args, address=address)
+        self.begin_batch()
+        try:
+            set_m1(*m1_args, address=address)
+            set_m2(*m2_args, address=address)
+        finally:
+            acked = self.flush_batch()
+        return acked
+
     # User accessible functions
     def send_random_data(self, cnt, address=None):
         """Send some randomly generated data of of a certain length. Don't know what this would be used for, but it was in the original driver code...
 
         :param int cnt: the number of bytes to randomly generate."""
-        buf = b''
-        for _ in range(cnt):
-            buf += pack('>B', os.urandom(1))
-        self._send(buf, address=address)
+        return self._send(os.urandom(cnt), address=address)
 
+    @_command(Cmd.M1FORWARD, _S_BB)
     def forward_m1(self, val, address=None):
         """Drive motor 1 forward.
 
         :param int val: Valid data range is 0 - 127. A value of 127 = full speed forward, 64 = about half speed forward and 0 = full stop.
         """
         # :Sends: [Address, 0, Value]
-        return self._send(pack('>BB', Cmd.M1FORWARD, val), address=address)
 
+    @_command(Cmd.M1BACKWARD, _S_BB)
     def backward_m1(self, val, address=None):
         """Drive motor 1 backwards.
 
         :param int val: Valid data range is 0 - 127. A value of 127 full speed backwards, 64 = about half speed backward and 0 = full stop.
         """
         # :Sends: [Address, 1, Value]
-        return self._send(pack('>BB', Cmd.M1BACKWARD, val), address=address)
 
     def set_min_voltage_main_battery(self, val, address=None):
         """Sets main battery (B- / B+) minimum voltage level. If the battery voltages drops below the set voltage level, RoboClaw will stop driving the motors. The voltage is set in .2 volt increments. The minimum value allowed which is 6V.
@@ -111,7 +528,7 @@ class Roboclaw:
         # translated byte value range = [0, 140]
         # The formula for calculating the voltage is: (Desired Volts - 6) x 5 = Value.
         # Examples of valid values are 6V = 0, 8V = 10 and 11V = 25.
-        return self._send(pack('>BB', Cmd.SETMINMB, int(val / 5 + 6)), address=address)
+        return self._send(_S_BB.pack(Cmd.SETMINMB, _min_voltage_value(val)), address=address)
 
     def set_max_voltage_main_battery(self, val, address=None):
         """Sets main battery (B- / B+) maximum voltage level. During regenerative breaking a back voltage is applied to charge the battery. When using a power supply, by setting the maximum voltage level, RoboClaw will, before exceeding it, go into hard braking mode until the voltage drops below the maximum value set. This will prevent overvoltage conditions when using power supplies.
@@ -122,88 +539,98 @@ class Roboclaw:
         # translated byte value range = [30, 175]
         # The formula for calculating the voltage is: Desired Volts x 5.12 = Value.
         # Examples of valid values are 12V = 62, 16V = 82 and 24V = 123.
-        return self._send(pack('>BB', Cmd.SETMAXMB, int(val / 5.12)), address=address)
+        return self._send(_S_BB.pack(Cmd.SETMAXMB, _max_voltage_value(val)), address=address)
 
+    @_command(Cmd.M2FORWARD, _S_BB)
     def forward_m2(self, val, address=None):
         """Drive motor 2 forward.
 
         :param int val: Valid data range is [0, 127]. A value of 127 full speed forward, 64 = about half speed forward and 0 = full stop.
         """
         # :Sends: [Address, 4, Value]
-        return self._send(pack('>BB', Cmd.M2FORWARD, val), address=address)
 
+    @_command(Cmd.M2BACKWARD, _S_BB)
     def backward_m2(self, val, address=None):
         """Drive motor 2 backwards.
 
         :param int val: Valid data range is [0, 127]. A value of 127 full speed backwards, 64 = about half speed backward and 0 = full stop.
         """
         # :Sends: [Address, 5, Value]
-        return self._send(pack('>BB', Cmd.M2BACKWARD, val), address=address)
 
+    @_command(Cmd.M17BIT, _S_BB)
     def forward_backward_m1(self, val, address=None):
         """Drive motor 1 forward or reverse.
 
         :param int val: Valid data range is [0, 127]. A value of 0 = full speed reverse, 64 = stop and 127 = full speed forward.
         """
         # :Sends: [Address, 6, Value]
-        return self._send(pack('>BB', Cmd.M17BIT, val), address=address)
 
+    @_command(Cmd.M27BIT, _S_BB)
     def forward_backward_m2(self, val, address=None):
         """Drive motor 2 forward or reverse.
 
         :param int val: Valid data range is [0, 127]. A value of 0 = full speed reverse, 64 = stop and 127 = full speed forward.
         """
         # :Sends: [Address, 7, Value]
-        return self._send(pack('>BB', Cmd.M27BIT, val), address=address)
 
+    @_command(Cmd.MIXEDFORWARD, _S_BB)
     def forward_mixed(self, val, address=None):
         """Drive forward in mix mode.
 
         :param int val: Valid data range is [0, 127]. A value of 0 = full stop and 127 = full forward.
         """
         # :Sends: [Address, 8, Value]
-        return self._send(pack('>BB', Cmd.MIXEDFORWARD, val), address=address)
 
+    @_command(Cmd.MIXEDBACKWARD, _S_BB)
     def backward_mixed(self, val, address=None):
         """Drive backwards in mix mode.
 
         :param int val: Valid data range is [0, 127]. A value of 0 = full stop and 127 = full reverse.
         """
         # :Sends: [Address, 9, Value]
-        return self._send(pack('>BB', Cmd.MIXEDBACKWARD, val), address=address)
 
+    @_command(Cmd.MIXEDRIGHT, _S_BB)
     def turn_right_mixed(self, val, address=None):
         """Turn right in mix mode.
 
         :param int val: Valid data range is [0, 127]. A value of 0 = stop turn and 127 = full speed turn.
         """
         # :Sends: [Address, 10, Value]
-        return self._send(pack('>BB', Cmd.MIXEDRIGHT, val), address=address)
 
+    @_command(Cmd.MIXEDLEFT, _S_BB)
     def turn_left_mixed(self, val, address=None):
         """Turn left in mix mode.
 
         :param int val: Valid data range is [0, 127]. A value of 0 = stop turn and 127 = full speed turn.
         """
         # :Sends: [Address, 11, Value]
-        return self._send(pack('>BB', Cmd.MIXEDLEFT, val), address=address)
 
+    @_command(Cmd.MIXEDFB, _S_BB)
     def forward_backward_mixed(self, val, address=None):
         """Drive forward or backwards.
 
         :param int val: Valid data range is [0, 127]. A value of 0 = full backward, 64 = stop and 127 = full forward.
         """
         # :Sends: [Address, 12, Value]
-        return self._send(pack('>BB', Cmd.MIXEDFB, val), address=address)
 
+    @_command(Cmd.MIXEDLR, _S_BB)
     def left_right_mixed(self, val, address=None):
         """Turn left or right.
 
         :param int val: Valid data range is [0, 127]. A value of 0 = full left, 64 = stop turn and 127 = full right.
         """
         # :Sends: [Address, 13, Value]
-        return self._send(pack('>BB', Cmd.MIXEDLR, val), address=address)
 
+    def drive_mixed(self, throttle, turn, address=None):
+        """Drive forward/backwards and turn left/right in mix mode. Both commands are sent in a single serial write (instead of calling `forward_backward_mixed()` and `left_right_mixed()` one after the other).
+
+        :param int throttle: Valid data range is [0, 127]. A value of 0 = full backward, 64 = stop and 127 = full forward.
+        :param int turn: Valid data range is [0, 127]. A value of 0 = full left, 64 = stop turn and 127 = full right.
+        """
+        # :Sends: [Address, 12, Value, CRC(2 bytes), Address, 13, Value, CRC(2 bytes)]
+        return self._send_many((_S_BB.pack(Cmd.MIXEDFB, throttle), _S_BB.pack(Cmd.MIXEDLR, turn)), address=address)
+
+    @_getter(Cmd.GETM1ENC, _S_iB)
     def read_encoder_m1(self, address=None):
         """Read M1 encoder count/position.
 
@@ -218,8 +645,8 @@ class Roboclaw:
         * Bit2 - Counter Overflow (1= Underflow Occurred, Clear After Reading)
         * Bit3 through Bit7 - Reserved
         """
-        return unpack('>iB', _recv(self._send(pack('>B', Cmd.GETM1ENC), address=address, ack=5)))
 
+    @_getter(Cmd.GETM2ENC, _S_IB)
     def read_encoder_m2(self, address=None):
         """ Read M2 encoder count/position.
 
@@ -235,8 +662,8 @@ class Roboclaw:
         * Bit3 through Bit7 - Reserved
 
         """
-        return unpack('>IB', _recv(self._send(pack('>B', Cmd.GETM2ENC), address=address, ack=5)))
 
+    @_getter(Cmd.GETM1SPEED, _S_IB)
     def read_speed_m1(self, address=None):
         """Read M1 counter speed. Returned value is in pulses per second. MCP keeps track of how many pulses received per second for both encoder channels.
 
@@ -244,8 +671,8 @@ class Roboclaw:
 
         Status indicates the direction (0 – forward, 1 - backward).
         """
-        return unpack('>IB', _recv(self._send(pack('>B', Cmd.GETM1SPEED), address=address, ack=5)))
 
+    @_getter(Cmd.GETM2SPEED, _S_IB)
     def read_speed_m2(self, address=None):
         """Read M2 counter speed. Returned value is in pulses per second. MCP keeps track of how many pulses received per second for both encoder channels.
 
@@ -253,49 +680,66 @@ class Roboclaw:
 
         Status indicates the direction (0 – forward, 1 - backward).
         """
-        return unpack('>IB', _recv(self._send(pack('>B', Cmd.GETM2SPEED), address=address, ack=5)))
 
+    @_getter(Cmd.GETENCODERS, _S_ii)
+    def read_encoders(self, address=None):
+        """Read both M1 and M2 encoder counts/positions with a single command. Use this instead of calling `read_encoder_m1()` and `read_encoder_m2()` back to back (one serial round trip instead of two).
+
+        :Returns: [Enc1(4 bytes), Enc2(4 bytes)]
+        """
+
+    @_getter(Cmd.GETSPEEDS, _S_ii)
+    def read_speeds(self, address=None):
+        """Read both M1 and M2 average speeds with a single command. Returned values are in pulses per second and signed by direction. Use this instead of calling `read_speed_m1()` and `read_speed_m2()` back to back (one serial round trip instead of two).
+
+        :Returns: [Speed1(4 bytes), Speed2(4 bytes)]
+        """
+
+    @_command(Cmd.RESETENC, _S_B)
     def reset_encoders(self, address=None):
         """Will reset both quadrature decoder counters to zero. This command applies to quadrature encoders only."""
-        return self._send(pack('>B', Cmd.RESETENC), address=address)
 
-    def read_version(self, address=None):
+    def read_version(self, address=None, force=False):
         """Read RoboClaw firmware version. Returns up to 48 bytes(depending on the Roboclaw model) and is terminated by a line feed character and a null character.
 
+        :param bool force: The firmware version can't change while the RoboClaw is powered, so it is only read from the device once and then cached. Pass `True` to skip the cache (eg. to detect a re-connected controller).
+
         :Returns: ["MCP266 2x60A v1.0.0",10,0]
 
         The command will return up to 48 bytes. The return string includes the product name and firmware version. The return string is terminated with a line feed (10) and null (0) character.
         """
-        version = _recv(self._send(pack('>B', Cmd.GETVERSION), address=address, ack=0))
-        if version:
-            return ''.join(chr(c) for c in version[:-2])
-        return 'Unknown. Read command failed'
-
+        key = self._address if address is None else address
+        if not force and key in self._versions:
+            return self._versions[key]
+        try:
+            version = self._recv(self._send(_S_B.pack(Cmd.GETVERSION), address=address, ack=0))
+        except RoboclawError:
+            return 'Unknown. Read command failed'
+        self._versions[key] = bytes(version[:-2]).decode('ascii', 'replace')
+        return self._versions[key]
+
+    @_command(Cmd.SETM1ENCCOUNT, _S_BI)
     def set_enc_m1(self, cnt, address=None):
         """Set the value of the Encoder 1 register. Useful when homing motor 1. This command applies to quadrature encoders only."""
-        return self._send(pack('>BI', Cmd.SETM1ENCCOUNT, cnt), address=address)
 
+    @_command(Cmd.SETM2ENCCOUNT, _S_BI)
     def set_enc_m2(self, cnt, address=None):
         """Set the value of the Encoder 2 register. Useful when homing motor 2. This command applies to quadrature encoders only."""
-        return self._send(pack('>BI', Cmd.SETM2ENCCOUNT, cnt), address=address)
 
+    @_getter(Cmd.GETMBATT, _S_h, _tenths)
     def read_main_battery_voltage(self, address=None):
         """Read the main battery voltage level connected to B+ and B- terminals.
 
         :Returns: The voltage is returned in 10ths of a volt (eg 30.0).
         """
         # :Returns: [Value(2 bytes)]The voltage is returned in 10ths of a volt(eg 300 = 30v).
-        return unpack('>h', _recv(self._send(pack('>B', Cmd.GETMBATT), address=address, ack=2)))[0] / 10
 
+    @_getter(Cmd.GETLBATT, _S_BB)
     def read_logic_battery_voltage(self, address=None):
         """Read a logic battery voltage level connected to LB+ and LB- terminals. The voltage is returned in 10ths of a volt(eg 50 = 5v).
 
         :Returns: [Value.Byte1, Value.Byte0]
         """
-        data = unpack('>BB', _recv(self._send(pack('>B', Cmd.GETLBATT), address=address, ack=2)))
-        if data:
-            return data
-        return (0, 0)
 
     def set_min_voltage_logic_battery(self, val, address=None):
         """
@@ -308,7 +752,7 @@ class Roboclaw:
         # translated byte value range = [0, 140]
         # The formula for calculating the voltage is: (Desired Volts - 6) x 5 = Value.
         # Examples of valid values are 6V = 0, 8V = 10 and 11V = 25.
-        return self._send(pack('>BB', Cmd.SETMINLB, int(val / 5 + 6), address=address))
+        return self._send(_S_BB.pack(Cmd.SETMINLB, _min_voltage_value(val)), address=address)
 
     def set_max_voltage_logic_battery(self, val, address=None):
         """Sets logic input (LB- / LB+) maximum voltage level. RoboClaw will shutdown with an error if the voltage is above this level.
@@ -320,34 +764,43 @@ class Roboclaw:
         # translated byte value ranges [30, 175]
         # The formula for calculating the voltage is: Desired Volts x 5.12 = Value.
         # Examples of valid values are 12V = 62, 16V = 82 and 24V = 123.
-        return self._send(pack('>BB', Cmd.SETMAXLB, int(val / 5.12), address=address))
+        return self._send(_S_BB.pack(Cmd.SETMAXLB, _max_voltage_value(val)), address=address)
 
+    @_command(Cmd.SETM1PID, _S_BIIII, _velocity_pid_args)
     def set_m1_velocity_pid(self, p, i, d, qpps, address=None):
         """Several motor and quadrature combinations can be used with RoboClaw. In some cases the default PID values will need to be tuned for the systems being driven. This gives greater flexibility in what motor and encoder combinations can be used. The RoboClaw PID system consist of four constants starting with QPPS, P = Proportional, I= Integral and D= Derivative.
 
-        :param int p: The default P is 0x00010000.
-        :param int i: The default I is 0x00008000.
-        :param int d: The default D is 0x00004000.
+        :param float p: The default P is 1.0 (0x00010000 in 16.16 fixed point).
+        :param float i: The default I is 0.5 (0x00008000 in 16.16 fixed point).
+        :param float d: The default D is 0.25 (0x00004000 in 16.16 fixed point).
         :param int qpps: The default QPPS is 44000.
 
         QPPS is the speed of the encoder when the motor is at 100% power. P, I, D are the default values used after a reset.
         """
         # :Sends: [Address, 28, D(4 bytes), P(4 bytes), I(4 bytes), QPPS(4 byte)]
-        return self._send(pack('>BIIII', Cmd.SETM1PID, d * 65536, p * 65536, i * 65536, qpps), address=address)
 
+    @_command(Cmd.SETM2PID, _S_BIIII, _velocity_pid_args)
     def set_m2_velocity_pid(self, p, i, d, qpps, address=None):
         """Several motor and quadrature combinations can be used with RoboClaw. In some cases the default PID values will need to be tuned for the systems being driven. This gives greater flexibility in what motor and encoder combinations can be used. The RoboClaw PID system consist of four constants starting with QPPS, P = Proportional, I= Integral and D= Derivative.
 
-        :param int p: The default P is 0x00010000.
-        :param int i: The default I is 0x00008000.
-        :param int d: The default D is 0x00004000.
+        :param float p: The default P is 1.0 (0x00010000 in 16.16 fixed point).
+        :param float i: The default I is 0.5 (0x00008000 in 16.16 fixed point).
+        :param float d: The default D is 0.25 (0x00004000 in 16.16 fixed point).
         :param int qpps: The default QPPS is 44000.
 
         QPPS is the speed of the encoder when the motor is at 100% power. P, I, D are the default values used after a reset.
         """
         # :Sends: [Address, 29, D(4 bytes), P(4 bytes), I(4 bytes), QPPS(4 byte)]
-        return self._send(pack('>BIIII', Cmd.SETM2PID, d * 65536, p * 65536, i * 65536, qpps), address=address)
 
+    def set_velocity_pids(self, m1, m2, address=None):
+        """Set the velocity PID of both motors in a single serial write (see `set_m1_velocity_pid()`).
+
+        :param tuple m1: The ``(p, i, d, qpps)`` of motor 1.
+        :param tuple m2: The ``(p, i, d, qpps)`` of motor 2.
+        """
+        return self._send_pair('velocity_pid', m1, m2, address)
+
+    @_getter(Cmd.GETM1ISPEED, _S_Ib)
     def read_raw_speed_m1(self, address=None):
         """Read the pulses counted in that last 300th of a second. This is an unfiltered version of `read_speed_m1()`. This function can be used to make a independent PID routine. Value returned is in encoder counts per second.
 
@@ -355,8 +808,8 @@ class Roboclaw:
 
         The Status byte is direction (0 – forward, 1 - backward).
         """
-        return unpack('>Ib', _recv(self._send(pack('>B', Cmd.GETM1ISPEED), address=address, ack=5)))
 
+    @_getter(Cmd.GETM2ISPEED, _S_Ib)
     def read_raw_speed_m2(self, address=None):
         """Read the pulses counted in that last 300th of a second. This is an unfiltered version of `read_speed_m2()`. This function can be used to make a independent PID routine. Value returned is in encoder counts per second.
 
@@ -364,24 +817,32 @@ class Roboclaw:
 
         The Status byte is direction (0 – forward, 1 - backward).
         """
-        return unpack('>Ib', _recv(self._send(pack('>B', Cmd.GETM2ISPEED), address=address, ack=5)))
 
+    @_getter(Cmd.GETISPEEDS, _S_ii)
+    def read_raw_speeds(self, address=None):
+        """Read both M1 and M2 raw (unfiltered) speeds with a single command. Returned values are the pulses counted in the last 300th of a second and signed by direction. Use this instead of calling `read_raw_speed_m1()` and `read_raw_speed_m2()` back to back (one serial round trip instead of two).
+
+        :Returns: [Speed1(4 bytes), Speed2(4 bytes)]
+        """
+        # :Sends: [Address, 79]
+
+    @_command(Cmd.M1DUTY, _S_Bh)
     def duty_m1(self, val, address=None):
         """Drive M1 using a duty cycle value. The duty cycle is used to control the speed of the motor without a quadrature encoder.
 
         :param int val: The duty value is signed and the range [-32767, 32767] (eg. +-100% duty).
         """
         # :Sends: [Address, 32, Duty(2 Bytes)]
-        return self._send(pack('>Bh', Cmd.M1DUTY, val), address=address)
 
+    @_command(Cmd.M2DUTY, _S_Bh)
     def duty_m2(self, val, address=None):
         """Drive M2 using a duty cycle value. The duty cycle is used to control the speed of the motor without a quadrature encoder.
 
         :param int val: The duty value is signed and the range [-32767, 32767] (eg. +-100% duty).
         """
         # :Sends: [Address, 33, Duty(2 Bytes)]
-        return self._send(pack('>Bh', Cmd.M2DUTY, val), address=address)
 
+    @_command(Cmd.MIXEDDUTY, _S_Bhh)
     def duty_m1_m2(self, m1, m2, address=None):
         """Drive both M1 and M2 using a duty cycle value. The duty cycle is used to control the speed of the motor without a quadrature encoder.
 
@@ -389,24 +850,24 @@ class Roboclaw:
         :param int m2: The duty value is signed and the range [-32767, 32767] (eg. +-100% duty).
         """
         # :Sends: [Address, 34, DutyM1(2 Bytes), DutyM2(2 Bytes)]
-        return self._send(pack('>Bhh', Cmd.MIXEDDUTY, m1, m2), address=address)
 
+    @_command(Cmd.M1SPEED, _S_Bi)
     def speed_m1(self, val, address=None):
         """Drive M1 using a speed value. The sign indicates which direction the motor will turn. This command is used to drive the motor by quad pulses per second. Different quadrature encoders will have different rates at which they generate the incoming pulses. The values used will differ from one encoder to another. Once a value is sent the motor will begin to accelerate as fast as possible until the defined rate is reached.
 
         :param int val: Valid input ranges [-2147483647, 2147483647].
         """
         # :Sends: [Address, 35, Speed(4 Bytes)]
-        return self._send(pack('>Bi', Cmd.M1SPEED, val), address=address)
 
+    @_command(Cmd.M2SPEED, _S_Bi)
     def speed_m2(self, val, address=None):
         """Drive M2 with a speed value. The sign indicates which direction the motor will turn. This command is used to drive the motor by quad pulses per second. Different quadrature encoders will have different rates at which they generate the incoming pulses. The values used will differ from one encoder to another. Once a value is sent, the motor will begin to accelerate as fast as possible until the rate defined is reached.
 
         :param int val: Valid input ranges [-2147483647, 2147483647].
         """
         # :Sends: [Address, 36, Speed(4 Bytes)]
-        return self._send(pack('>Bi', Cmd.M2SPEED, val), address=address)
 
+    @_command(Cmd.MIXEDSPEED, _S_Bii)
     def speed_m1_m2(self, m1, m2, address=None):
         """Drive M1 and M2 in the same command using a signed speed value. The sign indicates which direction the motor will turn. This command is used to drive the motor by quad pulses per second. Different quadrature encoders will have different rates at which they generate the incoming pulses. The values used will differ from one encoder to another. Once a value is sent the motor will begin to accelerate as fast as possible until the rate defined is reached.
 
@@ -414,80 +875,80 @@ class Roboclaw:
         :param int m2: Valid input ranges [-2147483647, 2147483647].
         """
         # :Sends: [Address, 37, SpeedM1(4 Bytes), SpeedM2(4 Bytes)]
-        return self._send(pack('>Bii', Cmd.MIXEDSPEED, m1, m2), address=address)
 
+    @_command(Cmd.M1SPEEDACCEL, _S_BIi)
     def speed_accel_m1(self, accel, speed, address=None):
         """Drive M1 with a signed speed and acceleration value. The sign indicates which direction the motor will run. The acceleration values are not signed. This command is used to drive the motor by quad pulses per second and using an acceleration value for ramping. Different quadrature encoders will have different rates at which they generate the incoming pulses. The values used will differ from one encoder to another. Once a value is sent the motor will begin to accelerate incrementally until the rate defined is reached.
 
         The acceleration is measured in speed increase per second. An acceleration value of 12,000 QPPS with a speed of 12,000 QPPS would accelerate a motor from 0 to 12,000 QPPS in 1 second. Another example would be an acceleration value of 24,000 QPPS and a speed value of 12,000 QPPS would accelerate the motor to 12,000 QPPS in 0.5 seconds.
         """
         # :Sends: [Address, 38, Accel(4 Bytes), Speed(4 Bytes)]
-        return self._send(pack('>BIi', Cmd.M1SPEEDACCEL, accel, speed), address=address)
 
+    @_command(Cmd.M2SPEEDACCEL, _S_BIi)
     def speed_accel_m2(self, accel, speed, address=None):
         """Drive M2 with a signed speed and acceleration value. The sign indicates which direction the motor will run. The acceleration value is not signed. This command is used to drive the motor by quad pulses per second and using an acceleration value for ramping. Different quadrature encoders will have different rates at which they generate the incoming pulses. The values used will differ from one encoder to another. Once a value is sent the motor will begin to accelerate incrementally until the rate defined is reached.
 
         The acceleration is measured in speed increase per second. An acceleration value of 12,000 QPPS with a speed of 12,000 QPPS would accelerate a motor from 0 to 12,000 QPPS in 1 second. Another example would be an acceleration value of 24,000 QPPS and a speed value of 12,000 QPPS would accelerate the motor to 12,000 QPPS in 0.5 seconds.
         """
         # :Sends: [Address, 39, Accel(4 Bytes), Speed(4 Bytes)]
-        return self._send(pack('>BIi', Cmd.M2SPEEDACCEL, accel, speed), address=address)
 
+    @_command(Cmd.MIXEDSPEEDACCEL, _S_BIii)
     def speed_accel_m1_m2(self, accel, speed1, speed2, address=None):
         """Drive M1 and M2 in the same command using one value for acceleration and two signed speed values for each motor. The sign indicates which direction the motor will run. The acceleration value is not signed. The motors are sync during acceleration. This command is used to drive the motor by quad pulses per second and using an acceleration value for ramping. Different quadrature encoders will have different rates at which they generate the incoming pulses. The values used will differ from one encoder to another. Once a value is sent the motor will begin to accelerate incrementally until the rate defined is reached.
 
         The acceleration is measured in speed increase per second. An acceleration value of 12,000 QPPS with a speed of 12,000 QPPS would accelerate a motor from 0 to 12,000 QPPS in 1 second. Another example would be an acceleration value of 24,000 QPPS and a speed value of 12,000 QPPS would accelerate the motor to 12,000 QPPS in 0.5 seconds.
         """
         # :Sends: [Address, 40, Accel(4 Bytes), SpeedM1(4 Bytes), SpeedM2(4 Bytes)]
-        return self._send(pack('>BIii', Cmd.MIXEDSPEEDACCEL, accel, speed1, speed2), address=address)
 
+    @_command(Cmd.M1SPEEDDIST, _S_BiIB)
     def speed_distance_m1(self, speed, distance, buffer, address=None):
         """Drive M1 with a signed speed and distance value. The sign indicates which direction the motor will run. The distance value is not signed. This command is buffered. This command is used to control the top speed and total distance traveled by the motor. Each motor channel M1 and M2 have separate buffers. This command will execute immediately if no other command for that channel is executing, otherwise the command will be buffered in the order it was sent. Any buffered or executing command can be stopped when a new command is issued by setting the Buffer argument. All values used are in quad pulses per second.
 
         The Buffer argument can be set to a 1 or 0. If a value of 0 is used the command will be buffered and executed in the order sent. If a value of 1 is used the current running command is stopped, any other commands in the buffer are deleted and the new command is executed.
         """
         # :Sends: [Address, 41, Speed(4 Bytes), Distance(4 Bytes), Buffer]
-        return self._send(pack('>BiIB', Cmd.M1SPEEDDIST, speed, distance, buffer), address=address)
 
+    @_command(Cmd.M2SPEEDDIST, _S_BiIB)
     def speed_distance_m2(self, speed, distance, buffer, address=None):
         """Drive M2 with a speed and distance value. The sign indicates which direction the motor will run. The distance value is not signed. This command is buffered. Each motor channel M1 and M2 have separate buffers. This command will execute immediately if no other command for that channel is executing, otherwise the command will be buffered in the order it was sent. Any buffered or executing command can be stopped when a new command is issued by setting the Buffer argument. All values used are in quad pulses per second.
 
         The Buffer argument can be set to a 1 or 0. If a value of 0 is used the command will be buffered and executed in the order sent. If a value of 1 is used the current running command is stopped, any other commands in the buffer are deleted and the new command is executed.
         """
         # :Sends: [Address, 42, Speed(4 Bytes), Distance(4 Bytes), Buffer]
-        return self._send(pack('>BiIB', Cmd.M2SPEEDDIST, speed, distance, buffer), address=address)
 
+    @_command(Cmd.MIXEDSPEEDDIST, _S_BiIiIB)
     def speed_distance_m1_m2(self, speed1, distance1, speed2, distance2, buffer, address=None):
         """Drive M1 and M2 with a speed and distance value. The sign indicates which direction the motor will run. The distance value is not signed. This command is buffered. Each motor channel M1 and M2 have separate buffers. This command will execute immediately if no other command for that channel is executing, otherwise the command will be buffered in the order it was sent. Any buffered or executing command can be stopped when a new command is issued by setting the Buffer argument. All values used are in quad pulses per second.
 
         The Buffer argument can be set to a 1 or 0. If a value of 0 is used the command will be buffered and executed in the order sent. If a value of 1 is used the current running command is stopped, any other commands in the buffer are deleted and the new command is executed.
         """
         # :Sends: [Address, 43, SpeedM1(4 Bytes), DistanceM1(4 Bytes), SpeedM2(4 Bytes), DistanceM2(4 Bytes), Buffer]
-        return self._send(pack('>BiIiIB', Cmd.MIXEDSPEEDDIST, speed1, distance1, speed2, distance2, buffer), address=address)
 
+    @_command(Cmd.M1SPEEDACCELDIST, _S_BIiIB)
     def speed_accel_distance_m1(self, accel, speed, distance, buffer, address=None):
         """Drive M1 with a speed, acceleration and distance value. The sign indicates which direction the motor will run. The acceleration and distance values are not signed. This command is used to control the motors top speed, total distanced traveled and at what incremental acceleration value to use until the top speed is reached. Each motor channel M1 and M2 have separate buffers. This command will execute immediately if no other command for that channel is executing, otherwise the command will be buffered in the order it was sent. Any buffered or executing command can be stopped when a new command is issued by setting the Buffer argument. All values used are in quad pulses per second.
 
         The Buffer argument can be set to a 1 or 0. If a value of 0 is used the command will be buffered and executed in the order sent. If a value of 1 is used the current running command is stopped, any other commands in the buffer are deleted and the new command is executed.
         """
         # :Sends: [Address, 44, Accel(4 bytes), Speed(4 Bytes), Distance(4 Bytes), Buffer]
-        return self._send(pack('>BIiIB', Cmd.M1SPEEDACCELDIST, accel, speed, distance, buffer), address=address)
 
+    @_command(Cmd.M2SPEEDACCELDIST, _S_BIiIB)
     def speed_accel_distance_m2(self, accel, speed, distance, buffer, address=None):
         """Drive M2 with a speed, acceleration and distance value. The sign indicates which direction the motor will run. The acceleration and distance values are not signed. This command is used to control the motors top speed, total distanced traveled and at what incremental acceleration value to use until the top speed is reached. Each motor channel M1 and M2 have separate buffers. This command will execute immediately if no other command for that channel is executing, otherwise the command will be buffered in the order it was sent. Any buffered or executing command can be stopped when a new command is issued by setting the Buffer argument. All values used are in quad pulses per second.
 
         The Buffer argument can be set to a 1 or 0. If a value of 0 is used the command will be buffered and executed in the order sent. If a value of 1 is used the current running command is stopped, any other commands in the buffer are deleted and the new command is executed.
         """
         # :Sends: [Address, 45, Accel(4 bytes), Speed(4 Bytes), Distance(4 Bytes), Buffer]
-        return self._send(pack('>BIiIB', Cmd.M2SPEEDACCELDIST, accel, speed, distance, buffer), address=address)
 
+    @_command(Cmd.MIXEDSPEEDACCELDIST, _S_BIiIiIB)
     def speed_accel_distance_m1_m2(self, accel, speed1, distance1, speed2, distance2, buffer, address=None):
         """Drive M1 and M2 with a speed, acceleration and distance value. The sign indicates which direction the motor will run. The acceleration and distance values are not signed. This command is used to control both motors top speed, total distanced traveled and at what incremental acceleration value to use until the top speed is reached. Each motor channel M1 and M2 have separate buffers. This command will execute immediately if no other command for that channel is executing, otherwise the command will be buffered in the order it was sent. Any buffered or executing command can be stopped when a new command is issued by setting the Buffer argument. All values used are in quad pulses per second.
 
         The Buffer argument can be set to a 1 or 0. If a value of 0 is used the command will be buffered and executed in the order sent. If a value of 1 is used the current running command is stopped, any other commands in the buffer are deleted and the new command is executed.
         """
         # :Sends: [Address, 46, Accel(4 Bytes), SpeedM1(4 Bytes), DistanceM1(4 Bytes), SpeedM2(4 bytes), DistanceM2(4 Bytes), Buffer]
-        return self._send(pack('>BIiIiIB', Cmd.MIXEDSPEEDACCELDIST, accel, speed1, distance1, speed2, distance2, buffer), address=address)
 
+    @_getter(Cmd.GETBUFFERS, _S_BB, _with_status)
     def read_buffer_length(self, address=None):
         """Read both motor M1 and M2 buffer lengths. This command can be used to determine how many commands are waiting to execute.
 
@@ -495,48 +956,66 @@ class Roboclaw:
 
         The return values represent how many commands per buffer are waiting to be executed. The maximum buffer size per motor is 64 commands(0x3F). A return value of 0x80(128) indicates the buffer is empty. A return value of 0 indiciates the last command sent is executing. A value of 0x80 indicates the last command buffered has finished.
         """
-        val = unpack('>BB', _recv(self._send(pack('>B', Cmd.GETBUFFERS), address=address, ack=2)))
-        if val:
-            return (1, val[0], val[1])
-        return (0, 0, 0)
 
+    def wait_for_buffers(self, timeout=None, address=None):
+        """Block until the buffered commands of both motors have finished (see `read_buffer_length()`). The buffers are polled with an adaptive back off (starting at 5 ms and doubling up to 100 ms, reset whenever the buffers change) instead of flooding the serial link with status requests.
+
+        :param float timeout: The maximum amount of seconds to wait. Defaults to `None` (no limit).
+
+        :Returns: `True` if both buffers are empty, `False` if the ``timeout`` expired first.
+
+        A poll that fails (see `RoboclawError`) is retried after the back off.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay, prev = 0.005, None
+        while True:
+            try:
+                buffers = self.read_buffer_length(address=address)
+            except RoboclawError:
+                buffers = None  # a dropped reply, poll again
+            else:
+                if buffers[0] and buffers[1] == 0x80 and buffers[2] == 0x80:
+                    return True
+            delay = 0.005 if buffers != prev else min(delay * 2, 0.1)
+            prev = buffers
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+    @_getter(Cmd.GETPWMS, _S_hh, _with_status)
     def read_pwms(self, address=None):
         """Read the current PWM output values for the motor channels. The values returned are +/-32767. The duty cycle percent is calculated by dividing the Value by 327.67.
 
         :Returns: [M1 PWM(2 bytes), M2 PWM(2 bytes)]
         """
         # Send: [Address, 48]
-        val = unpack('>hh', _recv(self._send(pack('>B', Cmd.GETPWMS), address=address, ack=4)))
-        if val:
-            return (1, val[0], val[1])
-        return (0, 0, 0)
 
+    @_getter(Cmd.GETCURRENTS, _S_hh, _with_status)
     def read_currents(self, address=None):
         """Read the current draw from each motor in 10ma increments. The amps value is calculated by dividing the value by 100.
 
         :Returns: [M1 Current(2 bytes), M2 Currrent(2 bytes)]
         """
         # Send: [Address, 49]
-        val = unpack('>hh', _recv(self._send(pack('>B', Cmd.GETCURRENTS), address=address, ack=4)))
-        if val:
-            return (1, val[0], val[1])
-        return (0, 0, 0)
 
+    @_command(Cmd.MIXEDSPEED2ACCEL, _S_BIiIi)
     def speed_accel_m1_m2_2(self, accel1, speed1, accel2, speed2, address=None):
         """Drive M1 and M2 in the same command using one value for acceleration and two signed speed values for each motor. The sign indicates which direction the motor will run. The acceleration value is not signed. The motors are sync during acceleration. This command is used to drive the motor by quad pulses per second and using an acceleration value for ramping. Different quadrature encoders will have different rates at which they generate the incoming pulses. The values used will differ from one encoder to another. Once a value is sent the motor will begin to accelerate incrementally until the rate defined is reached.
 
         The acceleration is measured in speed increase per second. An acceleration value of 12,000 QPPS with a speed of 12,000 QPPS would accelerate a motor from 0 to 12,000 QPPS in 1 second. Another example would be an acceleration value of 24,000 QPPS and a speed value of 12,000 QPPS would accelerate the motor to 12,000 QPPS in 0.5 seconds.
         """
         # :Sends: [Address, 50, AccelM1(4 Bytes), SpeedM1(4 Bytes), AccelM2(4 Bytes), SpeedM2(4 Bytes)]
-        return self._send(pack('>BIiIi', Cmd.MIXEDSPEED2ACCEL, accel1, speed1, accel2, speed2), address=address)
 
+    @_command(Cmd.MIXEDSPEED2ACCELDIST, _S_BIiIIiIB)
     def speed_accel_distance_m1_m2_2(self, accel1, speed1, distance1, accel2, speed2, distance2, buffer, address=None):
-        """Drive M1 and M2 in the same command using one value for acceleration and two signed speed values for each motor. The sign indicates which direction the motor will run. The acceleration value is not signed. The motors are sync during acceleration. This command is used to drive the motor by quad pulses per second and using an acceleration value for ramping. Different quadrature encoders will have different rates at which they generate the incoming pulses. The values used will differ from one encoder to another. Once a value is sent the motor will begin to accelerate incrementally until the rate defined is reached.
+        """Drive M1 and M2 with a speed, acceleration and distance value for each motor. The sign indicates which direction the motor will run. The acceleration and distance values are not signed. This command is used to control both motors top speed, total distanced traveled and at what incremental acceleration value to use until the top speed is reached. Each motor channel M1 and M2 have separate buffers. This command will execute immediately if no other command for that channel is executing, otherwise the command will be buffered in the order it was sent. Any buffered or executing command can be stopped when a new command is issued by setting the Buffer argument. All values used are in quad pulses per second.
 
-        The acceleration is measured in speed increase per second. An acceleration value of 12,000 QPPS with a speed of 12,000 QPPS would accelerate a motor from 0 to 12,000 QPPS in 1 second. Another example would be an acceleration value of 24,000 QPPS and a speed value of 12,000 QPPS would accelerate the motor to 12,000 QPPS in 0.5 seconds.
+        The Buffer argument can be set to a 1 or 0. If a value of 0 is used the command will be buffered and executed in the order sent. If a value of 1 is used the current running command is stopped, any other commands in the buffer are deleted and the new command is executed.
         """
-        # :Sends: [Address, 50, AccelM1(4 Bytes), SpeedM1(4 Bytes), AccelM2(4 Bytes), SpeedM2(4 Bytes)]
-        return self._send(pack('>BIiIIiIB', Cmd.MIXEDSPEED2ACCELDIST, accel1, speed1, distance1, accel2, speed2, distance2, buffer), address=address)
+        # :Sends: [Address, 51, AccelM1(4 Bytes), SpeedM1(4 Bytes), DistanceM1(4 Bytes), AccelM2(4 Bytes), SpeedM2(4 Bytes), DistanceM2(4 Bytes), Buffer]
 
     def duty_accel_m1(self, accel, duty, address=None):
         """Drive M1 with a signed duty and acceleration value. The sign indicates which direction the motor will run. The acceleration values are not signed. This command is used to drive the motor by PWM and using an acceleration value for ramping. Accel is the rate per second at which the duty changes from the current duty to the specified duty.
@@ -544,7 +1023,7 @@ class Roboclaw:
         The duty value is signed and the range is -32768 to +32767(eg. +-100% duty). The accel value range is 0 to 655359(eg maximum acceleration rate is -100% to 100% in 100ms).
         """
         # :Sends: [Address, 52, Duty(2 bytes), Accel(2 Bytes)]
-        return self._send(pack('>BhI', Cmd.M1DUTYACCEL, duty, accel), address=address)
+        return self._send(_S_BhI.pack(Cmd.M1DUTYACCEL, duty, accel), address=address)
 
     def duty_accel_m2(self, accel, duty, address=None):
         """Drive M2 with a signed duty and acceleration value. The sign indicates which direction the motor will run. The acceleration values are not signed. This command is used to drive the motor by PWM and using an acceleration value for ramping. Accel is the rate at which the duty changes from the current duty to the specified dury.
@@ -552,7 +1031,7 @@ class Roboclaw:
         The duty value is signed and the range is -32768 to +32767 (eg. +-100% duty). The accel value range is 0 to 655359 (eg maximum acceleration rate is -100% to 100% in 100ms).
         """
         # :Sends: [Address, 53, Duty(2 bytes), Accel(2 Bytes)]
-        return self._send(pack('>BhI', Cmd.M2DUTYACCEL, duty, accel), address=address)
+        return self._send(_S_BhI.pack(Cmd.M2DUTYACCEL, duty, accel), address=address)
 
     def duty_accel_m1_m2(self, accel1, duty1, accel2, duty2, address=None):
         """Drive M1 and M2 in the same command using acceleration and duty values for each motor. The sign indicates which direction the motor will run. The acceleration value is not signed. This command is used to drive the motor by PWM using an acceleration value for ramping.
@@ -560,126 +1039,129 @@ class Roboclaw:
         The duty value is signed and the range is -32768 to +32767 (eg. +-100% duty). The accel value range is 0 to 655359 (eg maximum acceleration rate is -100% to 100% in 100ms).
         """
         # :Sends: [Address, CMD, DutyM1(2 bytes), AccelM1(4 Bytes), DutyM2(2 bytes), AccelM1(4 bytes)]
-        return self._send(pack('>BhIhI', Cmd.MIXEDDUTYACCEL, duty1, accel1, duty2, accel2), address=address)
+        return self._send(_S_BhIhI.pack(Cmd.MIXEDDUTYACCEL, duty1, accel1, duty2, accel2), address=address)
 
+    @_getter(Cmd.READM1PID, _S_iiii, _velocity_pid)
     def read_m1_velocity_pid(self, address=None):
         """Read the PID and QPPS Settings.
 
-        :Returns: [P(4 bytes), I(4 bytes), D(4 bytes), QPPS(4 byte)]
+        :Returns: [P, I, D, QPPS(4 byte)] (P, I and D are scaled from 16.16 fixed point, see `set_m1_velocity_pid()`)
         """
         # :Sends: [Address, 55]
-        data = unpack('iiii', _recv(self._send(pack('>B', Cmd.READM1PID), address=address, ack=16)))
-        if data:
-            return (data[0], data[1] / 65536.0, data[2] / 65536.0, data[3] / 65536.0)
-        return (0, 0, 0, 0)
 
+    @_getter(Cmd.READM2PID, _S_iiii, _velocity_pid)
     def read_m2_velocity_pid(self, address=None):
         """Read the PID and QPPS Settings.
 
-        :Returns: [P(4 bytes), I(4 bytes), D(4 bytes), QPPS(4 byte)]
+        :Returns: [P, I, D, QPPS(4 byte)] (P, I and D are scaled from 16.16 fixed point, see `set_m1_velocity_pid()`)
         """
         # :Sends: [Address, 55]
-        data = unpack('iiii', _recv(self._send(pack('>B', Cmd.READM2PID), address=address, ack=16)))
-        if data:
-            return (data[0], data[1] / 65536.0, data[2] / 65536.0, data[3] / 65536.0)
-        return (0, 0, 0, 0)
 
+    @_command(Cmd.SETMAINVOLTAGES, _S_BHH)
     def set_main_voltages(self, minimum, maximum, address=None):
         """Set the Main Battery Voltage cutoffs, Min and Max. Min and Max voltages are in 10th of a volt increments. Multiply the voltage to set by 10."""
         # :Sends: [Address, 57, Min(2 bytes), Max(2bytes]
-        return self._send(pack('>BHH', Cmd.SETMAINVOLTAGES, minimum, maximum), address=address)
 
+    @_command(Cmd.SETLOGICVOLTAGES, _S_BHH)
     def set_logic_voltages(self, minimum, maximum, address=None):
         """Set the Logic Battery Voltages cutoffs, Min and Max. Min and Max voltages are in 10th of a volt increments. Multiply the voltage to set by 10."""
         # :Sends: [Address, 58, Min(2 bytes), Max(2bytes]
-        return self._send(pack('>BHH', Cmd.SETLOGICVOLTAGES, minimum, maximum), address=address)
 
+    @_getter(Cmd.GETMINMAXMAINVOLTAGES, _S_HH, _with_status)
     def read_min_max_main_voltages(self, address=None):
         """Read the Main Battery Voltage Settings. The voltage is calculated by dividing the value by 10
 
         :Returns: [Min(2 bytes), Max(2 bytes)]
         """
-        val = unpack('>HH', _recv(self._send(pack('>B', Cmd.GETMINMAXMAINVOLTAGES), address=address, ack=4)))
-        if val:
-            return (1, val[0], val[1])
-        return (0, 0, 0)
 
+    @_getter(Cmd.GETMINMAXLOGICVOLTAGES, _S_HH, _with_status)
     def read_min_max_logic_voltages(self, address=None):
         """Read the Logic Battery Voltage Settings. The voltage is calculated by dividing the value by 10
 
         :Returns: [Min(2 bytes), Max(2 bytes)]
         """
-        val = unpack('>HH', _recv(self._send(pack('>B', Cmd.GETMINMAXLOGICVOLTAGES), address=address, ack=4)))
-        if val:
-            return (1, val[0], val[1])
-        return (0, 0, 0)
 
+    @_command(Cmd.SETM1POSPID, _S_BIIIIIII, _position_pid_args)
     def set_m1_position_pid(self, kp, ki, kd, kimax, deadzone, minimum, maximum, address=None):
         """The RoboClaw Position PID system consist of seven constants starting with P = Proportional, I= Integral and D= Derivative, MaxI = Maximum Integral windup, Deadzone in encoder counts, MinPos = Minimum Position and MaxPos = Maximum Position. The defaults values are all zero.
 
         Position constants are used only with the Position commands, 65,66 and 67 or when encoders are enabled in RC/Analog modes.
         """
         # :Sends: [Address, 61, D(4 bytes), P(4 bytes), I(4 bytes), MaxI(4 bytes), Deadzone(4 bytes), MinPos(4 bytes), MaxPos(4 bytes)]
-        return self._send(pack('>BIIIIIII', Cmd.SETM1POSPID, kd * 1024, kp * 1024, ki * 1024, kimax, deadzone, minimum, maximum), address=address)
 
+    @_command(Cmd.SETM2POSPID, _S_BIIIIIII, _position_pid_args)
     def set_m2_position_pid(self, kp, ki, kd, kimax, deadzone, minimum, maximum, address=None):
         """The RoboClaw Position PID system consist of seven constants starting with P = Proportional, I= Integral and D= Derivative, MaxI = Maximum Integral windup, Deadzone in encoder counts, MinPos = Minimum Position and MaxPos = Maximum Position. The defaults values are all zero.
 
         Position constants are used only with the Position commands, 65,66 and 67 or when encoders are enabled in RC/Analog modes.
         """
         # :Sends: [Address, 62, D(4 bytes), P(4 bytes), I(4 bytes), MaxI(4 bytes), Deadzone(4 bytes), MinPos(4 bytes), MaxPos(4 bytes)]
-        return self._send(pack('>BIIIIIII', Cmd.SETM2POSPID, kd * 1024, kp * 1024, ki * 1024, kimax, deadzone, minimum, maximum), address=address)
 
+    def set_position_pids(self, m1, m2, address=None):
+        """Set the position PID of both motors in a single serial write (see `set_m1_position_pid()`).
+
+        :param tuple m1: The ``(kp, ki, kd, kimax, deadzone, minimum, maximum)`` of motor 1.
+        :param tuple m2: The ``(kp, ki, kd, kimax, deadzone, minimum, maximum)`` of motor 2.
+        """
+        return self._send_pair('position_pid', m1, m2, address)
+
+    @_getter(Cmd.READM1POSPID, _S_IIIIIII, _position_pid)
     def read_m1_position_pid(self, address=None):
         """Read the Position PID Settings.
 
-        :Returns: [P(4 bytes), I(4 bytes), D(4 bytes), MaxI(4 byte), Deadzone(4 byte), MinPos(4 byte), MaxPos(4 byte)]
+        :Returns: [1, P, I, D, MaxI(4 byte), Deadzone(4 byte), MinPos(4 byte), MaxPos(4 byte)]
+
+        The P, I and D constants are scaled back to the values passed to `set_m1_position_pid()`.
         """
-        data = unpack('>IIIIIII', _recv(self._send(pack('>B', Cmd.READM1POSPID), address=address, ack=28)))
-        if data:
-            return (data[0], data[1] / 1024.0, data[2] / 1024.0, data[3] / 1024.0)
-        return (0, 0, 0, 0, 0, 0, 0)
+        # :Sends: [Address, 63]
+        # :Receives: [P(4 bytes), I(4 bytes), D(4 bytes), MaxI(4 byte), Deadzone(4 byte), MinPos(4 byte), MaxPos(4 byte)]
 
+    @_getter(Cmd.READM2POSPID, _S_IIIIIII, _position_pid)
     def read_m2_position_pid(self, address=None):
         """Read the Position PID Settings.
 
-        :Returns: [P(4 bytes), I(4 bytes), D(4 bytes), MaxI(4 byte), Deadzone(4 byte), MinPos(4 byte), MaxPos(4 byte)]
+        :Returns: [1, P, I, D, MaxI(4 byte), Deadzone(4 byte), MinPos(4 byte), MaxPos(4 byte)]
+
+        The P, I and D constants are scaled back to the values passed to `set_m2_position_pid()`.
         """
-        data = unpack('>IIIIIII', _recv(self._send(pack('>B', Cmd.READM2POSPID), address=address, ack=28)))
-        if data:
-            return (1, data[0] / 1024.0, data[1] / 1024.0, data[2] / 1024.0)
-        return (0, 0, 0, 0, 0, 0, 0)
+        # :Sends: [Address, 64]
+        # :Receives: [P(4 bytes), I(4 bytes), D(4 bytes), MaxI(4 byte), Deadzone(4 byte), MinPos(4 byte), MaxPos(4 byte)]
 
+    @_command(Cmd.M1SPEEDACCELDECCELPOS, _S_BIIIIB)
     def speed_accel_deccel_position_m1(self, accel, speed, deccel, position, buffer, address=None):
         """Move M1 position from the current position to the specified new position and hold the new position. Accel sets the acceleration value and deccel the decceleration value. QSpeed sets the speed in quadrature pulses the motor will run at after acceleration and before decceleration.
         """
         # :Sends: [Address, 65, Accel(4 bytes), Speed(4 Bytes), Deccel(4 bytes), Position(4 Bytes), Buffer]
-        return self._send(pack('>BIIIIB', Cmd.M1SPEEDACCELDECCELPOS, accel, speed, deccel, position, buffer), address=address)
 
+    @_command(Cmd.M2SPEEDACCELDECCELPOS, _S_BIIIIB)
     def speed_accel_deccel_position_m2(self, accel, speed, deccel, position, buffer, address=None):
         """Move M2 position from the current position to the specified new position and hold the new position. Accel sets the acceleration value and deccel the decceleration value. QSpeed sets the speed in quadrature pulses the motor will run at after acceleration and before decceleration.
         """
         # :Sends: [Address, 66, Accel(4 bytes), Speed(4 Bytes), Deccel(4 bytes), Position(4 Bytes), Buffer]
-        return self._send(pack('>BIIIIB', Cmd.M2SPEEDACCELDECCELPOS, accel, speed, deccel, position, buffer), address=address)
 
+    @_command(Cmd.MIXEDSPEEDACCELDECCELPOS, _S_BIIIIIIIIB)
     def speed_accel_deccel_position_m1_m2(self, accel1, speed1, deccel1, position1, accel2, speed2, deccel2, position2, buffer, address=None):
         """Move M1 & M2 positions from their current positions to the specified new positions and hold the new positions. Accel sets the acceleration value and deccel the decceleration value. QSpeed sets the speed in quadrature pulses the motor will run at after acceleration and before decceleration.
         """
         # :Sends: [Address, 67, AccelM1(4 bytes), SpeedM1(4 Bytes), DeccelM1(4 bytes), PositionM1(4 Bytes), AccelM2(4 bytes), SpeedM2(4 Bytes), DeccelM2(4 bytes), PositionM2(4 Bytes), Buffer]
-        return self._send(pack('>BIIIIIIIIB', Cmd.MIXEDSPEEDACCELDECCELPOS, accel1, speed1, deccel1, position1, accel2, speed2, deccel2, position2, buffer), address=address)
 
+    @_command(Cmd.SETM1DEFAULTACCEL, _S_BI)
     def set_m1_default_accel(self, accel, address=None):
         """Set the default acceleration for M1 when using duty cycle commands (`duty_m1()` and `duty_m1_m2()`) or when using Standard Serial, RC and Analog PWM modes.
         """
         # :Sends: [Address, 68, Accel(4 bytes)]
-        return self._send(pack('>BI', Cmd.SETM1DEFAULTACCEL, accel), address=address)
 
+    @_command(Cmd.SETM2DEFAULTACCEL, _S_BI)
     def set_m2_default_accel(self, accel, address=None):
         """Set the default acceleration for M2 when using duty cycle commands (`duty_m2()` and `duty_m1_m2()`) or when using Standard Serial, RC and Analog PWM modes.
         """
         # :Sends: [Address, 69, Accel(4 bytes)]
-        return self._send(pack('>BI', Cmd.SETM2DEFAULTACCEL, accel), address=address)
 
+    def set_default_accels(self, m1_accel, m2_accel, address=None):
+        """Set the default acceleration of both motors in a single serial write (see `set_m1_default_accel()`)."""
+        return self._send_pair('default_accel', (m1_accel,), (m2_accel,), address)
+
+    @_command(Cmd.SETPINFUNCTIONS, _S_BBBB)
     def set_pin_functions(self, s3mode, s4mode, s5mode, address=None):
         """Set modes for S3,S4 and S5.
 
@@ -703,37 +1185,31 @@ class Roboclaw:
         """
         # :Returns: [0xFF]
         # :Sends: [Address, 74, S3mode, S4mode, S5mode]
-        return self._send(pack('>BBBB', Cmd.SETPINFUNCTIONS, s3mode, s4mode, s5mode), address=address)
 
+    @_getter(Cmd.GETPINFUNCTIONS, _S_BBB, _with_status)
     def read_pin_functions(self, address=None):
         """Read mode settings for S3,S4 and S5. See `set_pin_functions()` for mode descriptions
 
         :Returns: [S3mode, S4mode, S5mode]
         """
         # :Sends: [Address, 75]
-        val = unpack('>BBB', _recv(self._send(pack('>B', Cmd.GETPINFUNCTIONS), address=address, ack=3)))
-        if val:
-            return (1, val[0], val[1], val[2])
-        return (0, 0, 0)
 
+    @_command(Cmd.SETDEADBAND, _S_BBB)
     def set_deadband(self, minimum, maximum, address=None):
         """Set RC/Analog mode control deadband percentage in 10ths of a percent. Default value is 25(2.5%). Minimum value is 0(no DeadBand), Maximum value is 250(25%).
         """
         # :Sends: [Address, 76, Reverse, Forward]
         # :Returns: [0xFF]
-        return self._send(pack('>BBB', Cmd.SETDEADBAND, minimum, maximum), address=address)
 
+    @_getter(Cmd.GETDEADBAND, _S_BB, _with_status)
     def get_deadband(self, address=None):
         """Read DeadBand settings in 10ths of a percent.
 
         :Returns: [Reverse, SForward]
         """
         # :Sends: [Address, 77]
-        val = unpack('>BB', _recv(self._send(pack('>B', Cmd.GETDEADBAND), address=address, ack=2)))
-        if val:
-            return (1, val[0], val[1])
-        return (0, 0, 0)
 
+    @_command(Cmd.RESTOREDEFAULTS, _S_B)
     def restore_defaults(self, address=None):
         """Reset Settings to factory defaults.
 
@@ -741,26 +1217,26 @@ class Roboclaw:
             Baudrate will change if not already set to 38400.  Communications will be lost.
         """
         # :Sends: [Address, 80]
-        return self._send(pack('>B', Cmd.RESTOREDEFAULTS), address=address)
 
+    @_getter(Cmd.GETTEMP, _S_h)
     def read_temp(self, address=None):
         """Read the board temperature. Value returned is in 10ths of degrees.
 
         :Returns: [Temperature(2 bytes)]
         """
-        return unpack('>h', _recv(self._send(pack('>B', Cmd.GETTEMP), address=address, ack=2)))
 
+    @_getter(Cmd.GETTEMP2, _S_h)
     def read_temp2(self, address=None):
         """Read the second board temperature(only on supported units). Value returned is in 10ths of degrees.
 
         :Returns: [Temperature(2 bytes)]
         """
-        return unpack('>h', _recv(self._send(pack('>B', Cmd.GETTEMP2), address=address, ack=2)))
 
+    @_getter(Cmd.GETERROR, _S_H, _error_flags)
     def read_error(self, address=None):
         """Read the current unit status.
 
-        :Returns: [Status]
+        :Returns: The Status(2 bytes) as an `~roboclaw.serial_commands.ErrorFlag` of these bits:
 
         ========================= ===============
         Function                  Status Bit Mask
@@ -774,40 +1250,43 @@ class Roboclaw:
         Main Battery High Error   0x0020
         Logic Battery High Error  0x0040
         Logic Battery Low Error   0x0080
+        M1 Driver Fault           0x0100
+        M2 Driver Fault           0x0200
         Main Battery High Warning 0x0400
         Main Battery Low Warning  0x0800
         Termperature Warning      0x1000
         Temperature2 Warning      0x2000
         ========================= ===============
         """
-        return unpack('>B', _recv(self._send(pack('>B', Cmd.GETERROR), address=address, ack=1)))
 
+    @_getter(Cmd.GETENCODERMODE, _S_BB, _with_status)
     def read_encoder_modes(self, address=None):
         """Read the encoder pins assigned for both motors.
 
         :Returns: [Enc1Mode, Enc2Mode]
         """
-        val = unpack('>BB', _recv(self._send(pack('>B', Cmd.GETENCODERMODE), address=address, ack=2)))
-        if val:
-            return (1, val[0], val[1])
-        return (0, 0, 0)
 
+    @_command(Cmd.SETM1ENCODERMODE, _S_BB)
     def set_m1_encoder_mode(self, mode, address=None):
         """Set the Encoder Pin for motor 1. See `read_encoder_modes()`."""
         # :Sends: [Address, 92, Pin]
-        return self._send(pack('>BB', Cmd.SETM1ENCODERMODE, mode), address=address)
 
+    @_command(Cmd.SETM2ENCODERMODE, _S_BB)
     def set_m2_encoder_mode(self, mode, address=None):
         """Set the Encoder Pin for motor 2. See `read_encoder_modes()`."""
         # :Sends: [Address, 93, Pin]
-        return self._send(pack('>BB', Cmd.SETM2ENCODERMODE, mode), address=address)
+
+    def set_encoder_modes(self, m1_mode, m2_mode, address=None):
+        """Set the Encoder Pin of both motors in a single serial write (see `set_m1_encoder_mode()`)."""
+        return self._send_pair('encoder_mode', (m1_mode,), (m2_mode,), address)
 
     def write_nvm(self, address=None):
         """Writes all settings to non-volatile memory. Values will be loaded after each power up.
         """
         # :Sends: [Address, 94]
-        return self._send(pack('>BI', Cmd.WRITENVM, 0xE22EAB7A), address=address)
+        return self._send(_S_BI.pack(Cmd.WRITENVM, 0xE22EAB7A), address=address)
 
+    @_getter(Cmd.READNVM, _S_BB)
     def read_nvm(self, address=None):
         """Read all settings from non-volatile memory.
 
@@ -817,8 +1296,8 @@ class Roboclaw:
             If baudrate changes or the control mode changes communications will be lost.
         """
         # :Sends: [Address, 95]
-        return unpack('>BB', _recv(self._send(pack('>B', Cmd.READNVM), address=address, ack=2)))
 
+    @_command(Cmd.SETCONFIG, _S_Bh)
     def set_config(self, config, address=None):
         """Set config bits for standard settings.
 
@@ -870,77 +1349,144 @@ class Roboclaw:
         """
         # :Sends: [Address, 98, Config(2 bytes)]
         # :Returns: [0xFF]
-        return self._send(pack('>Bh', Cmd.SETCONFIG, config), address=address)
 
+    @_getter(Cmd.GETCONFIG, _S_h)
     def get_config(self, address=None):
         """Read config bits for standard settings See `set_config()`.
 
         :Returns: [Config(2 bytes)]
         """
         # :Sends: [Address, 99]
-        return unpack('>h', _recv(self._send(pack('>B', Cmd.GETCONFIG), address=address, ack=2)))
 
     def set_m1_max_current(self, maximum, address=None):
         """Set Motor 1 Maximum Current Limit. Current value is in 10ma units. To calculate multiply current limit by 100.
         """
         # :Sends: [Address, 134, MaxCurrent(4 bytes), 0, 0, 0, 0]
-        return self._send(pack('>BII', Cmd.SETM1MAXCURRENT, maximum, 0), address=address)
+        return self._send(_S_BII.pack(Cmd.SETM1MAXCURRENT, maximum, 0), address=address)
 
     def set_m2_max_current(self, maximum, address=None):
         """Set Motor 2 Maximum Current Limit. Current value is in 10ma units. To calculate multiply current limit by 100.
         """
         # :Sends: [Address, 134, MaxCurrent(4 bytes), 0, 0, 0, 0]
-        return self._send(pack('>BII', Cmd.SETM2MAXCURRENT, maximum, 0), address=address)
+        return self._send(_S_BII.pack(Cmd.SETM2MAXCURRENT, maximum, 0), address=address)
 
+    def set_max_currents(self, m1_maximum, m2_maximum, address=None):
+        """Set the Maximum Current Limit of both motors (in 10ma units) in a single serial write (see `set_m1_max_current()`)."""
+        return self._send_pair('max_current', (m1_maximum,), (m2_maximum,), address)
+
+    @_getter(Cmd.GETM1MAXCURRENT, _S_II)
     def read_m1_max_current(self, address=None):
         """Read Motor 1 Maximum Current Limit. Current value is in 10ma units. To calculate divide value by 100. MinCurrent is always 0.
 
         :Returns: [MaxCurrent(4 bytes), MinCurrent(4 bytes)]
         """
-        data = unpack('>II', _recv(self._send(pack('>B', Cmd.GETM1MAXCURRENT), address=address, ack=8)))
-        if data:
-            return data
-        return (0, 0)
 
+    @_getter(Cmd.GETM2MAXCURRENT, _S_II)
     def read_m2_max_current(self, address=None):
         """Read Motor 2 Maximum Current Limit. Current value is in 10ma units. To calculate divide value by 100. MinCurrent is always 0.
 
         :Returns: [MaxCurrent(4 bytes), MinCurrent(4 bytes)]
         """
-        data = unpack('>II', _recv(self._send(pack('>B', Cmd.GETM2MAXCURRENT), address=address, ack=8)))
-        if data[0]:
-            return data
-        return (0, 0)
 
+    @_command(Cmd.SETPWMMODE, _S_BB)
     def set_pwm_mode(self, mode, address=None):
         """Set PWM Drive mode. Locked Antiphase(0) or Sign Magnitude(1).
         """
         # :Sends: [Address, 148, Mode]
-        return self._send(pack('>BB', Cmd.SETPWMMODE, mode), address=address)
 
+    @_getter(Cmd.GETPWMMODE, _S_B)
     def read_pwm_mode(self, address=None):
         """Read PWM Drive mode. See `set_pwm_mode()`.
 
         :Returns: [PWMMode]
         """
-        return unpack('>B', _recv(self._send(pack('>B', Cmd.GETPWMMODE), address=address, ack=1)))
 
     def read_eeprom(self, ee_address, address=None):
         """Read a value from the User EEProm memory(256 bytes).
 
         :Returns: [Value(2 bytes)]
+        :Raises RoboclawError: If the reply timed out or failed its checksum.
         """
         # :Sends: [Address, 252, EEProm Address(byte)]
-        val = unpack('>H', _recv(self._send(pack('>BB', Cmd.READEEPROM, ee_address), address=address, ack=2)))
-        if val:
-            return (1, val[0])
-        return (0, 0)
+        return (1,) + _S_H.unpack(self._recv(self._send(_S_BB.pack(Cmd.READEEPROM, ee_address), address=address, ack=2)))
+
+    def read_eeprom_bulk(self, start=0, count=256, address=None):
+        """Read a range of values from the User EEProm memory(256 bytes) in one serial transfer. All the read requests are written back-to-back and the replies are read in one pass instead of paying a full round trip per value like `read_eeprom()` does.
+
+        :param int start: The first EEProm address to read.
+        :param int count: The number of consecutive EEProm addresses to read. Defaults to all of them (addresses 0 to 255).
+
+        :Returns: A `list` of ``count`` values (2 bytes each). Values that were not received or failed the checksum are `None`.
+        """
+        # :Sends: [Address, 252, EEProm Address(byte)] * count
+        frames = b''.join(bytes(self._frame(_S_BB.pack(Cmd.READEEPROM, ee_address), address=address)) for ee_address in range(start, start + count))
+        size = 2 + (2 if self.packet_serial else 0)
+        if self._batch:
+            self._write_batch()
+        self._open()
+        self.serial_obj.write(frames)
+        replies = memoryview(self.serial_obj.read(count * size))  # sliced without copying
+        if len(replies) < count * size:
+            self._reset_input()  # the missing replies may still trickle in, don't read them as the next reply
+        values = [None] * count
+        for i in range(len(replies) // size):
+            # each reply's checksum continues from the checksum of its own request
+            try:
+                val = self._recv(replies[i * size:(i + 1) * size], _S_H.unpack_from(frames, i * 5 + 3)[0] if self.packet_serial else 0)
+            except RoboclawError:
+                continue
+            values[i] = _S_H.unpack(val)[0]
+        return values
 
     def write_eeprom(self, ee_address, ee_word, address=None):
-        """Get Priority Levels.
+        """Write a value to the User EEProm memory(256 bytes).
+
+        :Returns: `True` if the RoboClaw confirmed the write.
         """
         # :Sends: [Address, 253, Address(byte), Value(2 bytes)]
-        val = unpack('>B', _recv(self._send(pack('>BBH', Cmd.WRITEEEPROM, ee_address, ee_word), address=address, ack=1, crc=0)))
-        if val[1] == 0xaa:
-            return True
-        return False
+        # :Receives: [0xAA] (without a CRC16 checksum)
+        return self._send(_S_BBH.pack(Cmd.WRITEEEPROM, ee_address, ee_word), address=address, ack=1, crc=0) == b'\xaa'
+
+    def read_all_status(self, addresses=None, want=('read_pwms', 'read_currents', 'read_error', 'read_temp')):
+        """Read several values from each of several RoboClaws (eg. in multi-unit packet serial mode) with a single round trip per RoboClaw. The requests to a RoboClaw are all written back-to-back and its replies are read in one pass, instead of paying a full round trip per value. RoboClaws are still queried one after the other, because the replies of different units would collide on a shared bus.
+
+        :param list addresses: The addresses of the RoboClaws to read. Defaults to this object's `address`.
+        :param tuple want: The names of the ``read_*`` methods to read with. Only the methods that take no arguments and return a fixed size reply (eg. `read_pwms()`, `read_currents()`, `read_error()`, `read_temp()`, `read_encoders()`, `read_speeds()`) are supported.
+
+        :Returns: A `dict` mapping each name in ``want`` to a `list` with the value (as returned by that method) for each address. Values that were not received or failed the checksum are `None`.
+        :Raises ValueError: If a name in ``want`` isn't one of the supported methods.
+        """
+        specs = []
+        for name in want:
+            spec = getattr(getattr(type(self), name, None), 'spec', None)
+            if spec is None or spec[2] is None:
+                raise ValueError('Unsupported read method: {}'.format(name))
+            specs.append(spec)
+        crc_size = 2 if self.packet_serial else 0
+        total = sum(reply.size + crc_size for _, _, reply, _ in specs)
+        result = {name: [] for name in want}
+        if self._batch: # replies can't get past the queued acks
+            self._write_batch()
+        self._open()
+        for address in ([self._address] if addresses is None else addresses):
+            frames = [self._frame(_S_B.pack(cmd), address=address) for cmd, _, _, _ in specs]
+            self.serial_obj.write(b''.join(frames))
+            replies = memoryview(self.serial_obj.read(total))
+            if len(replies) < total:
+                self._reset_input()  # the missing replies may still trickle in, don't read them as the next unit's
+            offset = 0
+            for name, frame, (_, _, reply, convert) in zip(want, frames, specs):
+                size = reply.size + crc_size
+                val = None
+                if offset + size <= len(replies):
+                    try:
+                        # each reply's checksum continues from the checksum of its own request
+                        val = reply.unpack(self._recv(replies[offset:offset + size], _S_H.unpack_from(frame, 2)[0] if crc_size else 0))
+                    except RoboclawError:
+                        pass
+                    else:
+                        if convert is not None:
+                            val = convert(val)
+                result[name].append(val)
+                offset += size
+        return result
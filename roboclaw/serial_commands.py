@@ -1,5 +1,10 @@
 """Serial Command Enums"""
 # pylint: disable=bad-whitespace
+try:
+    from enum import IntFlag
+except ImportError: # MicroPython/CircuitPython have no `enum`, the flags are then plain `int` values
+    IntFlag = int
+
 class Cmd:
     """the domain of key/value pairs used for serial commands to the roboclaw.
     Each command represents a specfic function of the :py:class:`~roboclaw.Roboclaw`
@@ -77,6 +82,8 @@ class Cmd:
     GETPINFUNCTIONS          = 75   #: The `read_pin_functions` command byte
     SETDEADBAND              = 76   #: The `set_deadband` command byte
     GETDEADBAND              = 77   #: The `get_deadband` command byte
+    GETENCODERS              = 78   #: The `read_encoders` command byte
+    GETISPEEDS               = 79   #: The `read_raw_speeds` command byte
     RESTOREDEFAULTS          = 80   #: The `restore_defaults` command byte
     GETTEMP                  = 82   #: The `read_temp` command byte
     GETTEMP2                 = 83   #: The `read_temp2` command byte
@@ -88,6 +95,7 @@ class Cmd:
     READNVM                  = 95   #: The `read_nvm` command byte
     SETCONFIG                = 98   #: The `set_config` command byte
     GETCONFIG                = 99   #: The `get_config` command byte
+    GETSPEEDS                = 108  #: The `read_speeds` command byte
     SETM1MAXCURRENT          = 133  #: The `set_m1_max_current` command byte
     SETM2MAXCURRENT          = 134  #: The `set_m2_max_current` command byte
     GETM1MAXCURRENT          = 135  #: The `read_m1_max_current` command byte
@@ -97,3 +105,22 @@ class Cmd:
     READEEPROM               = 252  #: The `read_eeprom` command byte
     WRITEEEPROM              = 253  #: The `write_eeprom` command byte
     FLAGBOOTLOADER           = 255  #: The command byte
+
+class ErrorFlag(IntFlag):
+    """The bits of the unit status returned by :py:meth:`~roboclaw.Roboclaw.read_error`, so the
+    status can be tested with a mask (eg. ``status & ErrorFlag.E_STOP``) or listed by name."""
+    NORMAL                    = 0x0000
+    M1_OVERCURRENT_WARNING    = 0x0001
+    M2_OVERCURRENT_WARNING    = 0x0002
+    E_STOP                    = 0x0004
+    TEMPERATURE_ERROR         = 0x0008
+    TEMPERATURE2_ERROR        = 0x0010
+    MAIN_BATTERY_HIGH_ERROR   = 0x0020
+    LOGIC_BATTERY_HIGH_ERROR  = 0x0040
+    LOGIC_BATTERY_LOW_ERROR   = 0x0080
+    M1_DRIVER_FAULT           = 0x0100
+    M2_DRIVER_FAULT           = 0x0200
+    MAIN_BATTERY_HIGH_WARNING = 0x0400
+    MAIN_BATTERY_LOW_WARNING  = 0x0800
+    TEMPERATURE_WARNING       = 0x1000
+    TEMPERATURE2_WARNING      = 0x2000
@@ -28,36 +28,43 @@ class SerialUART(UART):
         ``1`` or ``2``. Defaults to ``1``.
     """
     def __init__(self, tx_pin=None, rx_pin=None, baudrate=9600, bits=8, parity=None, stop=1):
+        # kept to reinitialize the port after `close()`
+        self._config = dict(baudrate=baudrate, bits=bits, parity=parity, stop=stop)
+        self._pins = (tx_pin, rx_pin)
         if MICROPY:
-            super(SerialUART, self).__init__(
-                tx=tx_pin, rx=rx_pin, baudrate=baudrate, bits=bits, parity=parity, stop=stop
-            )
+            super(SerialUART, self).__init__(tx=tx_pin, rx=rx_pin, **self._config)
         else:
-            super(SerialUART, self).__init__(
-                tx_pin, rx_pin, baudrate=baudrate, bits=bits, parity=parity, stop=stop
-            )
+            super(SerialUART, self).__init__(tx_pin, rx_pin, **self._config)
+        self._initialized = True  # configured by the constructor, until `deinit()`
+
+    @property
+    def is_open(self):
+        """`True` unless the port was deinitialized by `close()` (like pySerial's
+        ``is_open``)."""
+        return self._initialized
+
+    def open(self):
+        """Reinitialize the port with the configuration it was constructed with. A port that
+        is still configured is not reinitialized, because that reconfigures the peripheral and
+        flushes its FIFOs."""
+        if not self._initialized:
+            if MICROPY:
+                self.init(tx=self._pins[0], rx=self._pins[1], **self._config)
+            else: # a deinitialized busio.UART can't be init()-ed again, only constructed
+                super(SerialUART, self).__init__(*self._pins, **self._config)
+            self._initialized = True
 
     def __enter__(self):
         """Used to reinitialize serial port with the correct configuration ("enter"
-        ``with`` block)"""
-        if MICROPY:
-            self.init(
-                baudrate=self.baudrate,
-                bits=self.bits,
-                parity=self.parity,
-                stop=self.stop,
-                tx=self.tx_pin,
-                rx=self.rx_pin)
-            return self
-        return super().__enter__()
+        ``with`` block), see `open()`."""
+        self.open()
+        return self
 
     # pylint: disable=arguments-differ
     def __exit__(self, *exc):
         """Deinitialize the serial port ("exit" ``with`` block)"""
-        if MICROPY:
-            self.deinit()
-            return False
-        return super().__exit__(*exc)
+        self.close()
+        return False
 
     def in_waiting(self):
         """The number of bytes waiting to be read on the open Serial port."""
@@ -65,6 +72,7 @@ class SerialUART(UART):
 
     def close(self):
         """ deinitialize the port """
+        self._initialized = False
         self.deinit()
 
     def read_until(self, size=None):
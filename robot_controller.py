@@ -1,86 +1,128 @@
+import os
 import zmq
-import json
 import signal
+import threading
 
 from serial import Serial
 from roboclaw import Roboclaw
-from time import sleep, perf_counter
-from math import copysign
+from struct import Struct
+from time import perf_counter
 
-def clamp(mn, mx, n): return min(max(n, mn), mx)
+# must match the packet serial baudrate configured on both RoboClaws, set
+# ROBOCLAW_BAUDRATE (eg. to 460800) once they have been configured for it
+BAUDRATE = int(os.environ.get("ROBOCLAW_BAUDRATE", 38400))
 
-# Shamelessly ripped from WPILib's differential drive
-def differential_ik(x_vel: float, z_rot: float) -> tuple[float, float]:
-    x_vel = clamp(-1.0, 1.0, x_vel)
-    z_rot = clamp(-1.0, 1.0, z_rot)
+# must match remote_controller.py: left stick y, right stick y (-127 to 127,
+# up is positive), left trigger, right trigger (0 or 1)
+CONTROLS = Struct("!bbBB")
 
-    # Square the inputs to make it less sensitive at low speed
-    x_vel = copysign(x_vel * x_vel, x_vel)
-    z_rot = copysign(z_rot * z_rot, z_rot)
+# Wheel duties (-32767 - 32767) that moved by at most this much since the
+# last write are not sent again (1/64 of full forward)
+DEADBAND = 512
 
-    speed_l = x_vel - z_rot
-    speed_r = x_vel + z_rot
+# Seconds without a controller state after which the wheels are stopped
+# (the remote resends unchanged controls at about 5 Hz)
+STALE_AFTER = 0.5
 
-    greater = max(abs(x_vel), abs(z_rot))
-    lesser = min(abs(x_vel), abs(z_rot))
+# Shamelessly ripped from WPILib's differential drive
+def differential_ik(x_vel: float, z_rot: float) -> tuple[float, float]:
+    if x_vel < -1.0: x_vel = -1.0
+    elif x_vel > 1.0: x_vel = 1.0
+    if z_rot < -1.0: z_rot = -1.0
+    elif z_rot > 1.0: z_rot = 1.0
+
+    # Square the inputs to make it less sensitive at low speed (the squares
+    # are also the magnitudes, so no abs() calls are needed)
+    x_mag = x_vel * x_vel
+    z_mag = z_rot * z_rot
+    x_vel = x_mag if x_vel >= 0.0 else -x_mag
+    z_rot = z_mag if z_rot >= 0.0 else -z_mag
+
+    if x_mag > z_mag:
+        greater, lesser = x_mag, z_mag
+    else:
+        greater, lesser = z_mag, x_mag
 
     if greater == 0.0:
         return (0.0, 0.0)
-    else:
-        saturated = (greater + lesser) / greater
 
-        speed_l /= saturated
-        speed_r /= saturated
-
-        return (speed_l, speed_r)
+    # Same as dividing both speeds by (greater + lesser) / greater
+    scale = greater / (greater + lesser)
+    return ((x_vel - z_rot) * scale, (x_vel + z_rot) * scale)
 
 class RobotController:
     def __init__(self, host, port):
         print(f"Listening on {host} : {port}")
 
         context = zmq.Context()
-        self.socket = context.socket(zmq.REP)
+        self.socket = context.socket(zmq.PULL)
+        # Only the newest controller state matters, don't queue up stale ones
+        self.socket.setsockopt(zmq.CONFLATE, 1)
+        # Detect a remote that went away without closing the connection, and
+        # don't wait on anything left in the socket when shutting down
+        self.socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
+        self.socket.setsockopt(zmq.LINGER, 0)
         self.socket.bind(f"tcp://{host}:{port}")
         
-        serial_kick = Serial('/dev/ttyS1', 38400)
-        serial_wheels = Serial('/dev/ttyUSB0', 38400)
+        # Don't block forever waiting for an ack of a RoboClaw that never
+        # answers (which would also hold up motor_kill())
+        serial_kick = Serial('/dev/ttyS1', BAUDRATE, timeout=0.05)
+        serial_wheels = Serial('/dev/ttyUSB0', BAUDRATE, timeout=0.05)
 
         self.rclaw_kick = Roboclaw(serial_kick)
         self.rclaw_wheels = Roboclaw(serial_wheels)
+        # Without it every reply from the USB adapter waits for its latency
+        # timer (16 ms by default)
+        if not self.rclaw_wheels.low_latency:
+            print("Warning: could not set low latency mode on /dev/ttyUSB0, "
+                  "try running as root or writing 1 to its latency_timer")
+
+        # Bound once here instead of looked up on every message
+        self._wheels = self.rclaw_wheels.duty_m1_m2
+        self._kick = self.rclaw_kick.forward_backward_m1
         
-        self.prev_command = None
+        # Trigger values of the previous message
+        self._prev_rt = self._prev_lt = 0
+        # Last wheel duties written to the RoboClaw
+        self._last_wheels = None
         # Prev wheels speed (python_roboclaw had some issues about reporting speeds)
         self.prev_wheels = (0.0, 0.0)
+        # Wheel speeds the ramp is heading to (from the last controller state)
+        self.target_wheels = (0.0, 0.0)
         # Linear acceleration rate (in percent output/s)
         self.ramp = 1.0
         # Last frame time
         self.prev_time = 0.0 # seconds
-
-    def execute(self, controller_state: str):
-        cs = controller_state.replace("\\", "").strip("\"")
-        cjson = {k: int(v) for (k, v) in dict(json.loads(cs)).items()}
-        
-        # TODO these need to be -1.0 to 1.0 range
-        right_stick = cjson["right_stick_y"]
-        left_stick = 127 - cjson["left_stick_y"]
-        right_trigger = cjson["right_trigger"]
-        left_trigger = cjson["left_trigger"]
-
-        if self.prev_command == None: self.prev_command = cjson
+        # Time the last controller state arrived
+        self._last_message = 0.0 # seconds
+
+        # Newest wheel duties and kick target for the writer thread (None when
+        # already written), so execute() never waits on the serial acks
+        self._next_wheels = self._next_kick = None
+        self._mailbox = threading.Lock()
+        self._mail = threading.Event()
+        # Serializes the RoboClaw writes of the writer thread and motor_kill()
+        self._serial_lock = threading.RLock()
+        # Set by motor_kill() (under _serial_lock), the writer thread then
+        # drops the duties it already took from the mailbox and exits
+        self._killed = False
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        # Set (eg. by the SIGINT handler) to make listen() return
+        self._stop = threading.Event()
+
+    def execute(self, controller_state: bytes):
+        if len(controller_state) != CONTROLS.size:
+            return
+        left_stick_y, right_stick_y, left_trigger, right_trigger = CONTROLS.unpack(controller_state)
+        self._last_message = perf_counter()
+
+        # -1.0 to 1.0 range
+        right_stick = right_stick_y / 127
+        left_stick = left_stick_y / 127
 
         # Differential driving
-        delta = perf_counter() - self.prev_time # seconds
-
-        target_wheels = differential_ik(left_stick, right_stick)
-        target_diff = ( min(target_wheels[0] - self.prev_wheels[0], delta * self.ramp)
-                      , min(target_wheels[1] - self.prev_wheels[1], delta * self.ramp)
-                      )
-        self.rclaw_wheels.forward_backward_m1(
-            clamp(-1.0, 1.0, self.prev_wheels[0] + target_diff[0])
-        )
-        self.rclaw_wheels.forward_backward_m2(
-            clamp(-1.0, 1.0, self.prev_wheels[1] + target_diff[1])
-        )
+        self.target_wheels = differential_ik(left_stick, right_stick)
+        self.tick_ramp()
 
         ## power the wheels based on tank controls
         # self.rclaw_wheels.forward_backward_m1(right_stick)
@@ -88,35 +130,116 @@ class RobotController:
         
         # Check if trigger state has changed because running commands over the 
         # USB bus is expensive
-        if (right_trigger, left_trigger) != (self.prev_command["right_trigger"], self.prev_command["left_trigger"]):
+        if right_trigger != self._prev_rt or left_trigger != self._prev_lt:
            rclaw_kick_target = min(64 + 64 * (left_trigger - right_trigger), 127)
-           self.rclaw_kick.forward_backward_m1(rclaw_kick_target)
-           self.rclaw_kick.forward_backward_m1(rclaw_kick_target)
-
-        self.prev_command = cjson
-
-    def listen(self):
-        self.prev_time = perf_counter()
-
+           self._post(kick=rclaw_kick_target)
+
+        self._prev_rt = right_trigger
+        self._prev_lt = left_trigger
+
+    def tick_ramp(self):
+        # Move the wheels one ramp step (for the time since the last frame)
+        # towards target_wheels, also called when no controller state arrived
+        now = perf_counter()
+        ramp_step = (now - self.prev_time) * self.ramp
+        self.prev_time = now
+        # The remote stalled or went away, don't keep driving
+        if now - self._last_message > STALE_AFTER:
+            self.target_wheels = (0.0, 0.0)
+
+        pw0, pw1 = self.prev_wheels
+        tw0, tw1 = self.target_wheels
+        n1 = pw0 + min(tw0 - pw0, ramp_step)
+        n2 = pw1 + min(tw1 - pw1, ramp_step)
+        if n1 < -1.0: n1 = -1.0
+        elif n1 > 1.0: n1 = 1.0
+        if n2 < -1.0: n2 = -1.0
+        elif n2 > 1.0: n2 = 1.0
+        self.prev_wheels = (n1, n2)
+
+        # -1.0 to 1.0 mapped onto the signed 16 bit duty of both motors, which
+        # are sent in a single packet (one CRC and one ack for both wheels)
+        duty_m1 = int(32767 * n1)
+        duty_m2 = int(32767 * n2)
+
+        # Skip the write while both duties stay within the deadband, but
+        # always send an exact stop
+        last = self._last_wheels
+        if last is None or (
+            (duty_m1, duty_m2) != last
+            and (abs(duty_m1 - last[0]) > DEADBAND or abs(duty_m2 - last[1]) > DEADBAND
+                 or (duty_m1 == 0 and last[0] != 0) or (duty_m2 == 0 and last[1] != 0))
+        ):
+            self._last_wheels = (duty_m1, duty_m2)
+            self._post(wheels=self._last_wheels)
+
+    def _post(self, wheels=None, kick=None):
+        # Replaces whatever the writer thread hasn't written yet
+        with self._mailbox:
+            if wheels is not None: self._next_wheels = wheels
+            if kick is not None: self._next_kick = kick
+        self._mail.set()
+
+    def _write_loop(self):
         while True:
-            controller_state = self.socket.recv_string()
-            controller_state.replace("\\", "")
+            self._mail.wait()
+            with self._mailbox:
+                self._mail.clear()
+                wheels, self._next_wheels = self._next_wheels, None
+                kick, self._next_kick = self._next_kick, None
+            with self._serial_lock:
+                if self._killed:
+                    return
+                try:
+                    if wheels is not None: self._wheels(*wheels)
+                    if kick is not None: self._kick(kick)
+                except Exception as e:
+                    # eg. the USB adapter was unplugged, don't keep listening
+                    # with nothing writing the commands
+                    print(f"Writer thread stopped: {e!r}")
+                    self._stop.set()
+                    return
 
-            self.execute(controller_state)
-            self.socket.send_string(f"Done")
-
-            self.prev_time = perf_counter()
+    def listen(self):
+        self._writer.start()
+        self.prev_time = self._last_message = perf_counter()
+
+        poller = zmq.Poller()
+        poller.register(self.socket, zmq.POLLIN)
+        while not self._stop.is_set():
+            # Wake up every 20 ms, so the ramp keeps going (and a stop request
+            # is noticed) while no controller state arrives
+            if poller.poll(20):
+                self.execute(self.socket.recv())
+            else:
+                self.tick_ramp()
+
+    def stop(self):
+        # Only sets a flag, so it is safe to call from a signal handler
+        self._stop.set()
 
     def motor_kill(self):
-        self.rclaw_wheels.forward_m1(0)
-        self.rclaw_wheels.forward_m2(0)
-        self.rclaw_kick.forward_m1(0)
-        self.rclaw_kick.forward_m2(0) 
-        sleep(1)
+        # Drop the commands the writer thread hasn't sent yet
+        with self._mailbox:
+            self._next_wheels = self._next_kick = None
+        # The writer thread holds the lock for at most a few ack timeouts,
+        # but never let it keep the stop commands from being sent
+        locked = self._serial_lock.acquire(timeout=0.5)
+        try:
+            self._killed = True
+            self.rclaw_wheels.forward_m1(0)
+            self.rclaw_wheels.forward_m2(0)
+            self.rclaw_kick.forward_m1(0)
+            self.rclaw_kick.forward_m2(0)
+        finally:
+            if locked:
+                self._serial_lock.release()
 
 def main():
     r = RobotController("*", 5555)
-    signal.signal(signal.SIGINT, lambda i, f: r.motor_kill())
+    # The motors are stopped by the main loop once listen() returns, not from
+    # inside the handler (which could interrupt a serial write)
+    signal.signal(signal.SIGINT, lambda signum, frame: r.stop())
 
     r.listen()
     r.motor_kill()